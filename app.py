@@ -9,6 +9,7 @@ A comprehensive dashboard for analyzing donation data with:
 - Period comparison tools
 """
 
+import importlib
 import streamlit as st
 from src.config.settings import (
     APP_TITLE,
@@ -17,13 +18,16 @@ from src.config.settings import (
     LAYOUT,
     INITIAL_SIDEBAR_STATE
 )
-from src.services.data_service import load_data, get_data_summary, export_to_csv
-from src.pages import (
-    render_overview_page,
-    render_ramadan_page,
-    render_temporal_page,
-    render_comparison_page
-)
+from src.services.data_service import load_data
+
+# Page renderers, imported on demand so only the active page's
+# dependencies are loaded
+PAGES = {
+    "Overview": "src.pages.overview:render_overview_page",
+    "Ramadan Analysis": "src.pages.ramadan:render_ramadan_page",
+    "Temporal Analysis": "src.pages.temporal:render_temporal_page",
+    "Comparison Tool": "src.pages.comparison:render_comparison_page",
+}
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -40,65 +44,73 @@ st.set_page_config(
 # CUSTOM CSS
 # ============================================================================
 
+# Colors are declared once as CSS custom properties; rules reference them
+# with var() so the stylesheet is a constant string rather than re-formatted
+# on every rerun.
+CUSTOM_CSS = """
+<style>
+    :root {
+        --app-bg: #ffffff;
+        --app-text: #0e1117;
+        --sidebar-bg: #f5f5f5;
+        --card-bg: #ffffff;
+        --border-color: #e6e6e6;
+    }
+    
+    /* Main app background */
+    .stApp {
+        background-color: var(--app-bg);
+        color: var(--app-text);
+    }
+    
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background-color: var(--sidebar-bg);
+    }
+    
+    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {
+        color: var(--app-text);
+    }
+    
+    /* Metric card styling */
+    [data-testid="stMetricValue"] {
+        font-size: 1.8rem;
+        color: var(--app-text);
+    }
+    
+    [data-testid="stMetricLabel"] {
+        color: var(--app-text);
+    }
+    
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    
+    /* Compact metric styling */
+    div[data-testid="stMetric"] {
+        background-color: var(--card-bg);
+        padding: 0.8rem;
+        border-radius: 0.5rem;
+        border: 1px solid var(--border-color);
+    }
+    
+    /* Radio button styling */
+    div[role="radiogroup"] label {
+        padding: 0.4rem 0;
+    }
+    
+    /* Divider styling */
+    hr {
+        margin: 0.8rem 0;
+        border-color: var(--border-color);
+    }
+</style>
+"""
+
+
 def load_custom_css():
     """Load custom CSS for better styling."""
-    bg_color = "#ffffff"
-    text_color = "#0e1117"
-    sidebar_bg = "#f5f5f5"
-    card_bg = "#ffffff"
-    border_color = "#e6e6e6"
-    
-    st.markdown(f"""
-    <style>
-        /* Main app background */
-        .stApp {{
-            background-color: {bg_color};
-            color: {text_color};
-        }}
-        
-        /* Sidebar styling */
-        [data-testid="stSidebar"] {{
-            background-color: {sidebar_bg};
-        }}
-        
-        [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {{
-            color: {text_color};
-        }}
-        
-        /* Metric card styling */
-        [data-testid="stMetricValue"] {{
-            font-size: 1.8rem;
-            color: {text_color};
-        }}
-        
-        [data-testid="stMetricLabel"] {{
-            color: {text_color};
-        }}
-        
-        /* Hide Streamlit branding */
-        #MainMenu {{visibility: hidden;}}
-        footer {{visibility: hidden;}}
-        
-        /* Compact metric styling */
-        div[data-testid="stMetric"] {{
-            background-color: {card_bg};
-            padding: 0.8rem;
-            border-radius: 0.5rem;
-            border: 1px solid {border_color};
-        }}
-        
-        /* Radio button styling */
-        div[role="radiogroup"] label {{
-            padding: 0.4rem 0;
-        }}
-        
-        /* Divider styling */
-        hr {{
-            margin: 0.8rem 0;
-            border-color: {border_color};
-        }}
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # ============================================================================
 # SIDEBAR
@@ -138,16 +150,9 @@ def render_sidebar():
 def main():
     """Main application entry point."""
     
-    # Initialize session state
-    if 'data' not in st.session_state:
-        st.session_state.data = None
-    
-    # Load data
-    if st.session_state.data is None:
-        with st.spinner("Loading data..."):
-            st.session_state.data = load_data()
-    
-    df = st.session_state.data
+    # Load data (cached across reruns and sessions)
+    with st.spinner("Loading data..."):
+        df = load_data()
     
     # Render sidebar and get navigation
     page = render_sidebar()
@@ -171,17 +176,9 @@ def main():
         return
     
     # Route to appropriate page
-    if page == "Overview":
-        render_overview_page(df)
-    
-    elif page == "Ramadan Analysis":
-        render_ramadan_page(df)
-    
-    elif page == "Temporal Analysis":
-        render_temporal_page(df)
-    
-    elif page == "Comparison Tool":
-        render_comparison_page(df)
+    module_name, func_name = PAGES[page].split(":")
+    render_page = getattr(importlib.import_module(module_name), func_name)
+    render_page(df)
 
 # ============================================================================
 # RUN APPLICATION
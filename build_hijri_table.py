@@ -0,0 +1,49 @@
+"""
+Hijri Lookup Table Builder
+This script precomputes Hijri calendar information for every Gregorian day
+in a fixed range so the app can enrich donations with a join instead of
+converting dates at load time.
+"""
+
+import pandas as pd
+from datetime import datetime
+from src.config.settings import HIJRI_LOOKUP_PATH
+from src.utils.hijri_calendar import build_hijri_lookup
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+START_DATE = '2000-01-01'
+END_DATE = '2050-12-31'
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def build_hijri_table():
+    """Build and save the date to Hijri lookup table."""
+    print("=" * 80)
+    print("HIJRI LOOKUP TABLE")
+    print("=" * 80)
+    print(f"\nStarting at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    dates = pd.date_range(START_DATE, END_DATE, freq='D')
+    print(f"\n[1/2] Converting {len(dates):,} days ({START_DATE} to {END_DATE})...")
+    table = build_hijri_lookup(dates)
+    table.index.name = 'date'
+    print(f"   ✓ Converted {len(table):,} days")
+
+    print(f"\n[2/2] Saving lookup table to {HIJRI_LOOKUP_PATH}...")
+    HIJRI_LOOKUP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    table.reset_index().to_parquet(HIJRI_LOOKUP_PATH, index=False, compression='zstd')
+    print(f"   ✓ Saved {len(table):,} rows")
+
+    print(f"\n✓ Completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 80)
+
+    return table
+
+
+if __name__ == '__main__':
+    build_hijri_table()
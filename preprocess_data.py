@@ -8,10 +8,11 @@ This script processes the raw donation data and adds:
 
 import pandas as pd
 from pathlib import Path
-from hijri_converter import Hijri, Gregorian
 from deep_translator import GoogleTranslator
 import time
 from datetime import datetime
+from src.utils.date_utils import add_time_dimensions
+from src.utils.hijri_calendar import build_hijri_lookup
 
 # ============================================================================
 # CONFIGURATION
@@ -20,72 +21,6 @@ from datetime import datetime
 INPUT_FILE = Path('data/General_Donation.csv')
 OUTPUT_FILE = Path('data/General_Donation_Processed.csv')
 
-# ============================================================================
-# HIJRI CALENDAR FUNCTIONS
-# ============================================================================
-
-def get_hijri_date(gregorian_date):
-    """Convert Gregorian date to Hijri date."""
-    try:
-        g = Gregorian(gregorian_date.year, gregorian_date.month, gregorian_date.day)
-        h = g.to_hijri()
-        return h
-    except:
-        return None
-
-def is_ramadan(gregorian_date):
-    """Check if a Gregorian date falls in Ramadan."""
-    hijri = get_hijri_date(gregorian_date)
-    if hijri:
-        return hijri.month == 9
-    return False
-
-def get_hijri_month_name(month_num):
-    """Get Hijri month name."""
-    months = {
-        1: 'Muharram', 2: 'Safar', 3: 'Rabi al-Awwal', 4: 'Rabi al-Thani',
-        5: 'Jumada al-Awwal', 6: 'Jumada al-Thani', 7: 'Rajab', 8: 'Shaban',
-        9: 'Ramadan', 10: 'Shawwal', 11: 'Dhul Qadah', 12: 'Dhul Hijjah'
-    }
-    return months.get(month_num, 'Unknown')
-
-def identify_islamic_events(gregorian_date):
-    """Identify Islamic events for a given date."""
-    hijri = get_hijri_date(gregorian_date)
-    if not hijri:
-        return None
-    
-    if hijri.month == 9:  # Ramadan
-        if 1 <= hijri.day <= 10:
-            return 'Ramadan (First 10 Days)'
-        elif 11 <= hijri.day <= 20:
-            return 'Ramadan (Middle 10 Days)'
-        else:
-            return 'Ramadan (Last 10 Days)'
-    elif hijri.month == 10 and hijri.day <= 3:
-        return 'Eid al-Fitr'
-    elif hijri.month == 12 and 8 <= hijri.day <= 13:
-        return 'Hajj & Eid al-Adha'
-    elif hijri.month == 1 and hijri.day == 10:
-        return 'Day of Ashura'
-    elif hijri.month == 3 and hijri.day == 12:
-        return 'Mawlid al-Nabi'
-    
-    return None
-
-def get_ramadan_period(gregorian_date):
-    """Get specific Ramadan period."""
-    hijri = get_hijri_date(gregorian_date)
-    if not hijri or hijri.month != 9:
-        return None
-    
-    if 1 <= hijri.day <= 10:
-        return 'First 10 Days'
-    elif 11 <= hijri.day <= 20:
-        return 'Middle 10 Days'
-    else:
-        return 'Last 10 Days'
-
 # ============================================================================
 # TRANSLATION FUNCTIONS
 # ============================================================================
@@ -169,61 +104,20 @@ def process_donation_data():
     
     # Extract time dimensions
     print("\n[3/5] Extracting time dimensions...")
-    df['year'] = df['donationdate'].dt.year
-    df['month'] = df['donationdate'].dt.month
-    df['month_name'] = df['donationdate'].dt.strftime('%B')
-    df['quarter'] = df['donationdate'].dt.quarter
-    df['day'] = df['donationdate'].dt.day
-    df['weekday'] = df['donationdate'].dt.day_name()
-    df['week'] = df['donationdate'].dt.isocalendar().week
-    df['hour'] = df['donationdate'].dt.hour
-    df['date'] = df['donationdate'].dt.date
+    df = add_time_dimensions(df)
     print("   ✓ Extracted Gregorian calendar dimensions")
     
     # Add Hijri calendar information
     print("\n[4/5] Adding Hijri calendar information...")
-    print("   Processing Hijri dates (this may take a moment)...")
-    
-    # Process in batches for progress tracking
-    batch_size = 10000
-    total_batches = (len(df) + batch_size - 1) // batch_size
-    
-    hijri_data = []
-    for i in range(0, len(df), batch_size):
-        batch = df.iloc[i:i+batch_size]
-        batch_num = i // batch_size + 1
-        print(f"   Processing batch {batch_num}/{total_batches}...", end='\r')
-        
-        for _, row in batch.iterrows():
-            date = row['donationdate'].date()
-            hijri = get_hijri_date(date)
-            
-            if hijri:
-                hijri_data.append({
-                    'hijri_year': hijri.year,
-                    'hijri_month': hijri.month,
-                    'hijri_day': hijri.day,
-                    'hijri_month_name': get_hijri_month_name(hijri.month),
-                    'is_ramadan': hijri.month == 9,
-                    'islamic_event': identify_islamic_events(date),
-                    'ramadan_period': get_ramadan_period(date) if hijri.month == 9 else None
-                })
-            else:
-                hijri_data.append({
-                    'hijri_year': None,
-                    'hijri_month': None,
-                    'hijri_day': None,
-                    'hijri_month_name': None,
-                    'is_ramadan': False,
-                    'islamic_event': None,
-                    'ramadan_period': None
-                })
     
-    print(f"\n   ✓ Processed Hijri dates for all {len(df):,} records")
+    # Convert each unique date once and map the results back onto every record
+    unique_dates = df['date'].nunique()
+    print(f"   Converting {unique_dates:,} unique dates...")
+    hijri_lookup = build_hijri_lookup(df['date'])
+    df = df.join(hijri_lookup, on='date')
+    df['is_ramadan'] = df['is_ramadan'].fillna(False).astype(bool)
     
-    # Add Hijri columns to dataframe
-    hijri_df = pd.DataFrame(hijri_data)
-    df = pd.concat([df, hijri_df], axis=1)
+    print(f"   ✓ Processed Hijri dates for all {len(df):,} records")
     
     # Count Ramadan records
     ramadan_count = df['is_ramadan'].sum()
@@ -257,7 +151,7 @@ def process_donation_data():
         'id', 'donationdate', 'amount', 
         'donationtype', 'donationtype_en',
         'year', 'month', 'month_name', 'quarter', 'day', 'weekday', 'week', 'hour', 'date',
-        'hijri_year', 'hijri_month', 'hijri_day', 'hijri_month_name',
+        'hijri_year', 'hijri_month', 'hijri_day',
         'is_ramadan', 'ramadan_period', 'islamic_event'
     ]
     
@@ -278,8 +172,8 @@ def process_donation_data():
     print(f"Total Amount:            AED {df['amount'].sum():,.2f}")
     print(f"Average Donation:        AED {df['amount'].mean():,.2f}")
     print(f"\nRamadan Donations:       {ramadan_count:,} ({ramadan_pct:.1f}%)")
-    print(f"Ramadan Amount:          AED {df[df['is_ramadan'] == True]['amount'].sum():,.2f}")
-    print(f"Non-Ramadan Amount:      AED {df[df['is_ramadan'] == False]['amount'].sum():,.2f}")
+    print(f"Ramadan Amount:          AED {df.loc[df['is_ramadan'], 'amount'].sum():,.2f}")
+    print(f"Non-Ramadan Amount:      AED {df.loc[~df['is_ramadan'], 'amount'].sum():,.2f}")
     print(f"\nUnique Donation Types:   {df['donationtype'].nunique()}")
     print(f"Unique Donors:           {df['id'].nunique():,}")
     
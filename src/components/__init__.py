@@ -1,8 +1,40 @@
 """Visualization components for the dashboard."""
 
-from .kpi_cards import *
-from .time_series_charts import *
-from .ramadan_charts import *
-from .category_charts import *
-from .temporal_charts import *
-from .donor_charts import *
+import importlib
+
+# Components are resolved on first access so a page importing one chart
+# module does not pull in every other chart module with it.
+_COMPONENTS = {
+    'display_kpi_cards': '.kpi_cards',
+    'display_ramadan_kpis': '.kpi_cards',
+    'display_comparison_metrics': '.kpi_cards',
+    'display_stat_card': '.kpi_cards',
+    'create_time_series_chart': '.time_series_charts',
+    'create_cumulative_chart': '.time_series_charts',
+    'create_moving_average_chart': '.time_series_charts',
+    'create_ramadan_comparison_chart': '.ramadan_charts',
+    'create_islamic_events_chart': '.ramadan_charts',
+    'create_hijri_months_chart': '.ramadan_charts',
+    'create_category_distribution': '.category_charts',
+    'create_category_bar_chart': '.category_charts',
+    'create_amount_distribution': '.category_charts',
+    'create_amount_range_distribution': '.category_charts',
+    'create_monthly_heatmap': '.temporal_charts',
+    'create_hourly_pattern': '.temporal_charts',
+    'create_weekday_pattern': '.temporal_charts',
+    'create_time_weekday_heatmap': '.temporal_charts',
+    'create_yearly_monthly_analysis': '.temporal_charts',
+    'create_top_donors_chart': '.donor_charts',
+    'create_donor_behavior_analysis': '.donor_charts',
+    'create_donor_retention_chart': '.donor_charts',
+    'create_donation_frequency_distribution': '.donor_charts',
+}
+
+__all__ = list(_COMPONENTS)
+
+
+def __getattr__(name):
+    if name in _COMPONENTS:
+        module = importlib.import_module(_COMPONENTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,13 +3,18 @@ Category and Distribution Charts
 Charts showing donation categories and distributions
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from ..config.theme import get_theme_colors, get_plot_template, get_chart_colors
 from ..config.settings import DEFAULT_CHART_HEIGHT, TOP_N_CATEGORIES
+from .figure_cache import cache_figure
+from ..services.metrics_service import aggregate_amounts
+from ..utils.array_utils import top_n_positions
 
 
+@cache_figure
 def create_category_distribution(
     df: pd.DataFrame, 
     top_n: int = TOP_N_CATEGORIES
@@ -26,31 +31,24 @@ def create_category_distribution(
     """
     column = 'donationtype_en' if 'donationtype_en' in df.columns else 'donationtype'
     
-    # Get all category data
-    all_category_data = df.groupby(column)['amount'].sum().sort_values(ascending=False)
+    totals = aggregate_amounts(df, column)['sum']
+    amounts = totals.to_numpy()
     
-    # Get top N categories
-    top_categories = all_category_data.head(top_n)
+    # Top N categories, largest first, without sorting every category
+    top = top_n_positions(amounts, top_n)[::-1]
+    labels = totals.index.to_numpy()[top]
+    values = amounts[top]
     
     # Calculate "Others" if there are more categories
-    if len(all_category_data) > top_n:
-        others_amount = all_category_data.iloc[top_n:].sum()
-        # Combine top categories with "Others"
-        category_data = pd.concat([
-            top_categories,
-            pd.Series({'Others': others_amount})
-        ])
-    else:
-        category_data = top_categories
-    
-    category_data = category_data.reset_index()
-    category_data.columns = ['category', 'amount']
+    if len(amounts) > top_n:
+        labels = np.append(labels, 'Others')
+        values = np.append(values, amounts.sum() - values.sum())
     
     colors = get_chart_colors()
     
     fig = go.Figure(data=[go.Pie(
-        labels=category_data['category'],
-        values=category_data['amount'],
+        labels=labels,
+        values=values,
         marker=dict(colors=colors),
         textinfo='label+percent',
         hovertemplate='<b>%{label}</b><br>Amount: AED %{value:,.0f}<br>Percentage: %{percent}<extra></extra>'
@@ -65,6 +63,7 @@ def create_category_distribution(
     return fig
 
 
+@cache_figure
 def create_category_bar_chart(
     df: pd.DataFrame, 
     top_n: int = TOP_N_CATEGORIES
@@ -81,28 +80,24 @@ def create_category_bar_chart(
     """
     column = 'donationtype_en' if 'donationtype_en' in df.columns else 'donationtype'
     
-    category_data = df.groupby(column).agg({
-        'amount': 'sum',
-        'id': 'count'
-    }).reset_index()
+    category_data = aggregate_amounts(df, column)
     
-    category_data.columns = [column, 'total_amount', 'count']
-    category_data = category_data.nlargest(top_n, 'total_amount')
-    category_data = category_data.sort_values('total_amount')
+    # Top N categories in ascending order, so the largest bar is drawn on top
+    top = top_n_positions(category_data['sum'].to_numpy(), top_n)
     
     colors = get_theme_colors()
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        y=category_data[column],
-        x=category_data['total_amount'],
+        y=category_data.index.to_numpy()[top],
+        x=category_data['sum'].to_numpy()[top],
         orientation='h',
         marker_color=colors['primary'],
-        text=category_data['total_amount'].apply(lambda x: f'AED {x:,.0f}'),
+        texttemplate='AED %{x:,.0f}',
         textposition='outside',
         hovertemplate='<b>%{y}</b><br>Total: AED %{x:,.0f}<br>Count: %{customdata:,}<extra></extra>',
-        customdata=category_data['count']
+        customdata=category_data['count'].to_numpy()[top]
     ))
     
     fig.update_layout(
@@ -116,6 +111,7 @@ def create_category_bar_chart(
     return fig
 
 
+@cache_figure
 def create_amount_distribution(df: pd.DataFrame) -> go.Figure:
     """
     Create amount distribution histogram.
@@ -128,13 +124,20 @@ def create_amount_distribution(df: pd.DataFrame) -> go.Figure:
     """
     colors = get_theme_colors()
     
+    # Bin server-side so only the 50 bin counts are sent to the browser
+    amounts = df['amount'].dropna().to_numpy()
+    counts, edges = np.histogram(amounts, bins=50)
+    
     fig = go.Figure()
     
-    fig.add_trace(go.Histogram(
-        x=df['amount'],
-        nbinsx=50,
+    fig.add_trace(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
         marker_color=colors['info'],
-        name='Distribution'
+        name='Distribution',
+        hovertemplate='AED %{customdata[0]:,.0f} - %{customdata[1]:,.0f}<br>Count: %{y:,}<extra></extra>'
     ))
     
     fig.update_layout(
@@ -149,6 +152,7 @@ def create_amount_distribution(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@cache_figure
 def create_amount_range_distribution(df: pd.DataFrame) -> go.Figure:
     """
     Create grouped amount range distribution.
@@ -163,12 +167,9 @@ def create_amount_range_distribution(df: pd.DataFrame) -> go.Figure:
     bins = [0, 100, 500, 1000, 5000, 10000, float('inf')]
     labels = ['0-100', '100-500', '500-1K', '1K-5K', '5K-10K', '10K+']
     
-    df_copy = df.copy()
-    df_copy['amount_range'] = pd.cut(df_copy['amount'], bins=bins, labels=labels)
-    
-    range_stats = df_copy.groupby('amount_range', observed=True).agg({
-        'amount': ['sum', 'count']
-    }).reset_index()
+    # Group the amounts by their range directly rather than copying the frame
+    amount_range = pd.cut(df['amount'], bins=bins, labels=labels)
+    range_stats = df['amount'].groupby(amount_range, observed=True).agg(['sum', 'size']).reset_index()
     
     range_stats.columns = ['range', 'total_amount', 'count']
     
@@ -180,7 +181,7 @@ def create_amount_range_distribution(df: pd.DataFrame) -> go.Figure:
         x=range_stats['range'],
         y=range_stats['count'],
         marker_color=colors[0],
-        text=range_stats['count'].apply(lambda x: f'{x:,}'),
+        texttemplate='%{y:,}',
         textposition='outside',
         name='Count'
     ))
@@ -3,13 +3,27 @@ Donor Analysis Charts
 Charts focused on donor behavior and patterns
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from ..config.theme import get_theme_colors, get_plot_template, get_chart_colors
 from ..config.settings import DEFAULT_CHART_HEIGHT, TOP_N_DONORS
+from ..services.metrics_service import aggregate_donors
+from ..utils.array_utils import top_n_positions
+from .figure_cache import cache_figure
+from .layouts import subplot_domains, subplot_row_layout
 
+# Subplot grid for the segmentation pies, built once instead of per render
+_SEGMENT_LAYOUT = subplot_row_layout(('Donors by Segment', 'Amount by Segment'), axes=False)
+_SEGMENT_DOMAINS = subplot_domains(2)
 
+# Donor segments by donation count; donors with at least _SEGMENT_EDGES[i]
+# donations fall in segment i + 1
+_SEGMENT_NAMES = np.array(['One-time', 'Occasional (2-4)', 'Regular (5-9)', 'Frequent (10+)'], dtype=object)
+_SEGMENT_EDGES = [2, 5, 10]
+
+
+@cache_figure
 def create_top_donors_chart(
     df: pd.DataFrame,
     top_n: int = TOP_N_DONORS
@@ -27,53 +41,45 @@ def create_top_donors_chart(
     if 'id' not in df.columns:
         return go.Figure()
     
-    donor_data = df.groupby('id').agg({
-        'amount': ['sum', 'count', 'mean']
-    }).reset_index()
-    
-    donor_data.columns = ['donor_id', 'total_amount', 'donation_count', 'avg_amount']
-    donor_data = donor_data.nlargest(top_n, 'total_amount')
-    donor_data['donor_label'] = [f"Donor {i+1}" for i in range(len(donor_data))]
-    
-    colors = get_theme_colors()
-    chart_colors = get_chart_colors()
-    
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=(f'Top {top_n} Donors by Amount', f'Top {top_n} Donors by Count'),
-        specs=[[{'type': 'bar'}, {'type': 'bar'}]]
-    )
+    donor_stats = aggregate_donors(df)
     
-    # By total amount
-    fig.add_trace(
-        go.Bar(
-            x=donor_data['donor_label'],
-            y=donor_data['total_amount'],
-            marker_color=chart_colors[0],
-            text=donor_data['total_amount'].apply(lambda x: f'AED {x:,.0f}'),
-            textposition='outside',
-            name='Total Amount'
-        ),
-        row=1, col=1
+    # Largest first, without sorting every donor
+    top = top_n_positions(donor_stats['total_amount'].to_numpy(), top_n)[::-1]
+    donor_data = donor_stats.iloc[top].assign(
+        donor_label=[f"Donor {i+1}" for i in range(len(top))]
     )
     
-    # By donation count
-    fig.add_trace(
-        go.Bar(
-            x=donor_data['donor_label'],
-            y=donor_data['donation_count'],
-            marker_color=chart_colors[1],
-            text=donor_data['donation_count'].apply(lambda x: f'{x:,}'),
-            textposition='outside',
-            name='Donation Count'
-        ),
-        row=1, col=2
-    )
+    chart_colors = get_chart_colors()
     
-    fig.update_layout(
-        template=get_plot_template(),
-        height=DEFAULT_CHART_HEIGHT,
-        showlegend=False
+    fig = go.Figure(
+        data=[
+            # By total amount
+            go.Bar(
+                x=donor_data['donor_label'],
+                y=donor_data['total_amount'],
+                marker_color=chart_colors[0],
+                texttemplate='AED %{y:,.0f}',
+                textposition='outside',
+                name='Total Amount',
+                xaxis='x', yaxis='y'
+            ),
+            # By donation count
+            go.Bar(
+                x=donor_data['donor_label'],
+                y=donor_data['donation_count'],
+                marker_color=chart_colors[1],
+                texttemplate='%{y:,}',
+                textposition='outside',
+                name='Donation Count',
+                xaxis='x2', yaxis='y2'
+            ),
+        ],
+        layout={
+            **subplot_row_layout((f'Top {top_n} Donors by Amount', f'Top {top_n} Donors by Count')),
+            'template': get_plot_template(),
+            'height': DEFAULT_CHART_HEIGHT,
+            'showlegend': False
+        }
     )
     
     fig.update_xaxes(tickangle=-45)
@@ -81,6 +87,7 @@ def create_top_donors_chart(
     return fig
 
 
+@cache_figure
 def create_donor_behavior_analysis(df: pd.DataFrame) -> go.Figure:
     """
     Create donor behavior segmentation chart.
@@ -94,65 +101,59 @@ def create_donor_behavior_analysis(df: pd.DataFrame) -> go.Figure:
     if 'id' not in df.columns:
         return go.Figure()
     
-    donor_stats = df.groupby('id').agg({
-        'amount': ['sum', 'count']
-    }).reset_index()
+    donor_stats = aggregate_donors(df)
     
-    donor_stats.columns = ['donor_id', 'total_amount', 'donation_count']
+    # Segment donors by bucketing their counts and summing per bucket,
+    # instead of labelling every donor with a string and grouping on it
+    counts = donor_stats['donation_count'].to_numpy()
+    segment = np.searchsorted(_SEGMENT_EDGES, counts, side='right')
+    n_segments = len(_SEGMENT_NAMES)
     
-    # Segment donors
-    donor_stats['segment'] = 'One-time'
-    donor_stats.loc[donor_stats['donation_count'] >= 2, 'segment'] = 'Occasional (2-4)'
-    donor_stats.loc[donor_stats['donation_count'] >= 5, 'segment'] = 'Regular (5-9)'
-    donor_stats.loc[donor_stats['donation_count'] >= 10, 'segment'] = 'Frequent (10+)'
-    
-    segment_stats = donor_stats.groupby('segment').agg({
-        'donor_id': 'count',
-        'total_amount': 'sum',
-        'donation_count': 'sum'
-    }).reset_index()
+    segment_stats = pd.DataFrame({
+        'segment': _SEGMENT_NAMES,
+        'donor_count': np.bincount(segment, minlength=n_segments),
+        'total_amount': np.bincount(
+            segment, weights=donor_stats['total_amount'].to_numpy(dtype=np.float64), minlength=n_segments
+        ),
+        'total_donations': np.bincount(segment, weights=counts, minlength=n_segments).astype(np.int64)
+    })
     
-    segment_stats.columns = ['segment', 'donor_count', 'total_amount', 'total_donations']
+    # Keep the segments that have donors, in the label order of the pies
+    segment_stats = segment_stats[segment_stats['donor_count'] > 0].sort_values('segment')
     
     colors = get_chart_colors()
     
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Donors by Segment', 'Amount by Segment'),
-        specs=[[{'type': 'pie'}, {'type': 'pie'}]]
-    )
-    
-    fig.add_trace(
-        go.Pie(
-            labels=segment_stats['segment'],
-            values=segment_stats['donor_count'],
-            marker=dict(colors=colors),
-            textinfo='label+percent',
-            name='Donor Count'
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Pie(
-            labels=segment_stats['segment'],
-            values=segment_stats['total_amount'],
-            marker=dict(colors=colors),
-            textinfo='label+percent',
-            name='Total Amount'
-        ),
-        row=1, col=2
-    )
-    
-    fig.update_layout(
-        title="Donor Behavior Segmentation",
-        template=get_plot_template(),
-        height=DEFAULT_CHART_HEIGHT
+    fig = go.Figure(
+        data=[
+            go.Pie(
+                labels=segment_stats['segment'],
+                values=segment_stats['donor_count'],
+                marker=dict(colors=colors),
+                textinfo='label+percent',
+                name='Donor Count',
+                domain=dict(x=_SEGMENT_DOMAINS[0], y=[0.0, 1.0])
+            ),
+            go.Pie(
+                labels=segment_stats['segment'],
+                values=segment_stats['total_amount'],
+                marker=dict(colors=colors),
+                textinfo='label+percent',
+                name='Total Amount',
+                domain=dict(x=_SEGMENT_DOMAINS[1], y=[0.0, 1.0])
+            ),
+        ],
+        layout={
+            **_SEGMENT_LAYOUT,
+            'title': "Donor Behavior Segmentation",
+            'template': get_plot_template(),
+            'height': DEFAULT_CHART_HEIGHT
+        }
     )
     
     return fig
 
 
+@cache_figure
 def create_donor_retention_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create donor retention/repeat rate chart.
@@ -167,8 +168,7 @@ def create_donor_retention_chart(df: pd.DataFrame) -> go.Figure:
         return go.Figure()
     
     # Calculate donors per year
-    yearly_donors = df.groupby(['year', 'id']).size().reset_index()
-    yearly_donors = yearly_donors.groupby('year')['id'].nunique().reset_index()
+    yearly_donors = df.groupby('year', observed=True)['id'].nunique().reset_index()
     yearly_donors.columns = ['year', 'unique_donors']
     
     colors = get_theme_colors()
@@ -179,7 +179,7 @@ def create_donor_retention_chart(df: pd.DataFrame) -> go.Figure:
         x=yearly_donors['year'],
         y=yearly_donors['unique_donors'],
         marker_color=colors['success'],
-        text=yearly_donors['unique_donors'].apply(lambda x: f'{x:,}'),
+        texttemplate='%{y:,}',
         textposition='outside',
         name='Unique Donors'
     ))
@@ -195,6 +195,7 @@ def create_donor_retention_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@cache_figure
 def create_donation_frequency_distribution(df: pd.DataFrame) -> go.Figure:
     """
     Create donation frequency distribution chart.
@@ -208,11 +209,10 @@ def create_donation_frequency_distribution(df: pd.DataFrame) -> go.Figure:
     if 'id' not in df.columns:
         return go.Figure()
     
-    donor_counts = df.groupby('id').size().reset_index()
-    donor_counts.columns = ['donor_id', 'donation_count']
+    donor_counts = aggregate_donors(df)['donation_count']
     
     # Create frequency distribution
-    freq_dist = donor_counts['donation_count'].value_counts().sort_index().reset_index()
+    freq_dist = donor_counts.value_counts().sort_index().reset_index()
     freq_dist.columns = ['donations', 'donor_count']
     freq_dist = freq_dist[freq_dist['donations'] <= 20]  # Limit to 20 for readability
     
@@ -224,7 +224,7 @@ def create_donation_frequency_distribution(df: pd.DataFrame) -> go.Figure:
         x=freq_dist['donations'],
         y=freq_dist['donor_count'],
         marker_color=colors['info'],
-        text=freq_dist['donor_count'].apply(lambda x: f'{x:,}'),
+        texttemplate='%{y:,}',
         textposition='outside',
         name='Donor Count'
     ))
@@ -0,0 +1,40 @@
+"""
+Figure Cache
+Caching decorator for chart builders that stores figures as JSON
+"""
+
+import functools
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+from ..config.settings import CACHE_TTL
+from ..utils.cache_utils import FRAME_HASH_FUNCS
+
+
+def cache_figure(func):
+    """
+    Cache a chart builder's figure as its serialized JSON spec.
+
+    The spec is a plain string, so st.cache_data stores and copies it
+    cheaply and cached entries do not depend on plotly's object internals.
+    Each hit rebuilds the figure with plotly.io.from_json; skip_invalid
+    drops any property the installed plotly no longer accepts instead of
+    failing the page.
+
+    Args:
+        func: Function taking a DataFrame (and options) and returning a Figure
+
+    Returns:
+        Function with the same signature returning a cached Figure
+    """
+    @st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
+    @functools.wraps(func)
+    def build_spec(*args, **kwargs) -> str:
+        return func(*args, **kwargs).to_json()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> go.Figure:
+        return pio.from_json(build_spec(*args, **kwargs), skip_invalid=True)
+
+    wrapper.clear = build_spec.clear
+    return wrapper
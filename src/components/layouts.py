@@ -0,0 +1,66 @@
+"""
+Chart Layouts
+Precomputed subplot layouts shared by multi-panel charts
+"""
+
+from typing import Sequence
+
+
+def subplot_domains(cols: int) -> list:
+    """
+    Compute the horizontal domain of each cell in a single-row grid.
+    
+    Uses the same spacing as plotly's make_subplots (0.2 / cols).
+    
+    Args:
+        cols: Number of columns
+        
+    Returns:
+        List of [start, end] paper coordinates, one per column
+    """
+    spacing = 0.2 / cols
+    width = (1 - spacing * (cols - 1)) / cols
+    return [[i * (width + spacing), i * (width + spacing) + width] for i in range(cols)]
+
+
+def subplot_row_layout(titles: Sequence[str], axes: bool = True) -> dict:
+    """
+    Build the layout of a single-row subplot grid as a plain dict.
+    
+    Equivalent to the layout produced by make_subplots, but built without
+    instantiating and validating an intermediate figure. Bar traces are
+    placed in cell i with xaxis='x{i}' / yaxis='y{i}' (no suffix for the
+    first cell); domain traces such as pies use subplot_domains() instead.
+    
+    Args:
+        titles: Subplot titles, one per column
+        axes: Whether to create cartesian axes for each cell
+        
+    Returns:
+        Layout dict with axis domains and title annotations
+    """
+    domains = subplot_domains(len(titles))
+    layout = {
+        'annotations': [
+            {
+                'text': title,
+                'x': (start + end) / 2,
+                'y': 1.0,
+                'xref': 'paper',
+                'yref': 'paper',
+                'xanchor': 'center',
+                'yanchor': 'bottom',
+                'showarrow': False,
+                'font': {'size': 16},
+            }
+            for title, (start, end) in zip(titles, domains)
+        ]
+    }
+    
+    if axes:
+        for i, domain in enumerate(domains, start=1):
+            suffix = str(i) if i > 1 else ''
+            layout[f'xaxis{suffix}'] = {'anchor': f'y{suffix}', 'domain': domain}
+            layout[f'yaxis{suffix}'] = {'anchor': f'x{suffix}', 'domain': [0.0, 1.0]}
+    
+    return layout
@@ -3,14 +3,23 @@ Ramadan Analysis Charts
 Charts specific to Ramadan analysis
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import streamlit as st
-from ..config.theme import get_theme_colors, get_plot_template, get_chart_colors
+from ..config.theme import get_plot_template, get_chart_colors
 from ..config.settings import DEFAULT_CHART_HEIGHT
+from ..utils.hijri_calendar import hijri_month_names
+from .figure_cache import cache_figure
+from ..services.metrics_service import aggregate_amounts
+from .layouts import subplot_row_layout
 
+# Subplot grids are built once instead of through make_subplots per render
+_COMPARISON_LAYOUT = subplot_row_layout(('Total Amount', 'Average Donation', 'Number of Donations'))
+_EVENTS_LAYOUT = subplot_row_layout(('Total Donations by Islamic Event', 'Average Donation by Event'))
 
+
+@cache_figure
 def create_ramadan_comparison_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create Ramadan vs Non-Ramadan comparison.
@@ -21,69 +30,55 @@ def create_ramadan_comparison_chart(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure object
     """
-    colors = get_theme_colors()
     chart_colors = get_chart_colors()
     
-    # Group by Ramadan status
-    comparison = df.groupby('is_ramadan').agg({
-        'amount': ['sum', 'mean', 'count']
-    }).reset_index()
-    
-    comparison.columns = ['is_ramadan', 'total_amount', 'avg_amount', 'count']
-    comparison['period'] = comparison['is_ramadan'].map({True: 'Ramadan', False: 'Non-Ramadan'})
-    
-    fig = make_subplots(
-        rows=1, cols=3,
-        subplot_titles=('Total Amount', 'Average Donation', 'Number of Donations'),
-        specs=[[{'type': 'bar'}, {'type': 'bar'}, {'type': 'bar'}]]
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=comparison['period'],
-            y=comparison['total_amount'],
-            marker_color=[chart_colors[3], chart_colors[0]],
-            text=comparison['total_amount'].apply(lambda x: f'AED {x:,.0f}'),
-            textposition='outside',
-            showlegend=False
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=comparison['period'],
-            y=comparison['avg_amount'],
-            marker_color=[chart_colors[3], chart_colors[0]],
-            text=comparison['avg_amount'].apply(lambda x: f'AED {x:,.2f}'),
-            textposition='outside',
-            showlegend=False
-        ),
-        row=1, col=2
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=comparison['period'],
-            y=comparison['count'],
-            marker_color=[chart_colors[3], chart_colors[0]],
-            text=comparison['count'].apply(lambda x: f'{x:,}'),
-            textposition='outside',
-            showlegend=False
-        ),
-        row=1, col=3
-    )
-    
-    fig.update_layout(
-        title="Ramadan vs Non-Ramadan Comparison",
-        template=get_plot_template(),
-        height=DEFAULT_CHART_HEIGHT,
-        showlegend=False
+    # Group by Ramadan status; plot straight from the aggregate's index
+    comparison = aggregate_amounts(df, 'is_ramadan')
+    periods = np.where(comparison.index, 'Ramadan', 'Non-Ramadan')
+    
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=periods,
+                y=comparison['sum'],
+                marker_color=[chart_colors[3], chart_colors[0]],
+                texttemplate='AED %{y:,.0f}',
+                textposition='outside',
+                showlegend=False,
+                xaxis='x', yaxis='y'
+            ),
+            go.Bar(
+                x=periods,
+                y=comparison['mean'],
+                marker_color=[chart_colors[3], chart_colors[0]],
+                texttemplate='AED %{y:,.2f}',
+                textposition='outside',
+                showlegend=False,
+                xaxis='x2', yaxis='y2'
+            ),
+            go.Bar(
+                x=periods,
+                y=comparison['count'],
+                marker_color=[chart_colors[3], chart_colors[0]],
+                texttemplate='%{y:,}',
+                textposition='outside',
+                showlegend=False,
+                xaxis='x3', yaxis='y3'
+            ),
+        ],
+        layout={
+            **_COMPARISON_LAYOUT,
+            'title': "Ramadan vs Non-Ramadan Comparison",
+            'template': get_plot_template(),
+            'height': DEFAULT_CHART_HEIGHT,
+            'showlegend': False
+        }
     )
     
     return fig
 
 
+@cache_figure
 def create_islamic_events_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create Islamic events distribution chart.
@@ -97,56 +92,44 @@ def create_islamic_events_chart(df: pd.DataFrame) -> go.Figure:
     if 'islamic_event' not in df.columns:
         return go.Figure()
     
-    # Filter out null events and get top events
-    events_df = df[df['islamic_event'].notna()].copy()
+    # Null events are dropped by the grouping; keep the top events
+    event_stats = aggregate_amounts(df, 'islamic_event')
     
-    if events_df.empty:
+    if event_stats.empty:
         return go.Figure()
     
-    event_stats = events_df.groupby('islamic_event').agg({
-        'amount': ['sum', 'mean', 'count']
-    }).reset_index()
-    
-    event_stats.columns = ['event', 'total_amount', 'avg_amount', 'count']
-    event_stats = event_stats.nlargest(10, 'total_amount')
+    event_stats = event_stats.nlargest(10, 'sum')
     
     colors = get_chart_colors()
     
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Total Donations by Islamic Event', 'Average Donation by Event'),
-        specs=[[{'type': 'bar'}, {'type': 'bar'}]]
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=event_stats['event'],
-            y=event_stats['total_amount'],
-            marker_color=colors[0],
-            name='Total Amount',
-            text=event_stats['total_amount'].apply(lambda x: f'AED {x:,.0f}'),
-            textposition='outside'
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Bar(
-            x=event_stats['event'],
-            y=event_stats['avg_amount'],
-            marker_color=colors[1],
-            name='Avg Amount',
-            text=event_stats['avg_amount'].apply(lambda x: f'AED {x:,.0f}'),
-            textposition='outside'
-        ),
-        row=1, col=2
-    )
-    
-    fig.update_layout(
-        title="Donations During Islamic Events",
-        template=get_plot_template(),
-        height=DEFAULT_CHART_HEIGHT,
-        showlegend=False
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=event_stats.index,
+                y=event_stats['sum'],
+                marker_color=colors[0],
+                name='Total Amount',
+                texttemplate='AED %{y:,.0f}',
+                textposition='outside',
+                xaxis='x', yaxis='y'
+            ),
+            go.Bar(
+                x=event_stats.index,
+                y=event_stats['mean'],
+                marker_color=colors[1],
+                name='Avg Amount',
+                texttemplate='AED %{y:,.0f}',
+                textposition='outside',
+                xaxis='x2', yaxis='y2'
+            ),
+        ],
+        layout={
+            **_EVENTS_LAYOUT,
+            'title': "Donations During Islamic Events",
+            'template': get_plot_template(),
+            'height': DEFAULT_CHART_HEIGHT,
+            'showlegend': False
+        }
     )
     
     fig.update_xaxes(tickangle=-45)
@@ -154,6 +137,7 @@ def create_islamic_events_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@cache_figure
 def create_hijri_months_chart(df: pd.DataFrame) -> go.Figure:
     """
     Create Hijri months analysis chart.
@@ -164,29 +148,26 @@ def create_hijri_months_chart(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly Figure object
     """
-    if 'hijri_month_name' not in df.columns:
+    if 'hijri_month' not in df.columns:
         return go.Figure()
     
-    hijri_df = df[df['hijri_month_name'].notna()].copy()
+    # Group on the integer month and attach names to the 12 result rows only
+    monthly_stats = aggregate_amounts(df, 'hijri_month')
     
-    if hijri_df.empty:
+    if monthly_stats.empty:
         return go.Figure()
     
-    monthly_stats = hijri_df.groupby('hijri_month_name').agg({
-        'amount': ['sum', 'mean', 'count']
-    }).reset_index()
-    
-    monthly_stats.columns = ['month', 'total_amount', 'avg_amount', 'count']
+    months = hijri_month_names(monthly_stats.index.to_series())
     
     colors = get_chart_colors()
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=monthly_stats['month'],
-        y=monthly_stats['total_amount'],
+        x=months,
+        y=monthly_stats['sum'],
         marker_color=colors[2],
-        text=monthly_stats['total_amount'].apply(lambda x: f'AED {x:,.0f}'),
+        texttemplate='AED %{y:,.0f}',
         textposition='outside',
         hovertemplate='<b>%{x}</b><br>Total: AED %{y:,.0f}<extra></extra>'
     ))
@@ -3,13 +3,17 @@ Temporal Analysis Charts
 Charts showing temporal patterns (hourly, daily, monthly)
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from ..config.theme import get_theme_colors, get_plot_template, get_chart_colors
 from ..config.settings import DEFAULT_CHART_HEIGHT, HEATMAP_HEIGHT
+from .figure_cache import cache_figure
+from ..services.metrics_service import aggregate_amounts
 
 
+@cache_figure
 def create_monthly_heatmap(df: pd.DataFrame) -> go.Figure:
     """
     Create monthly donation heatmap.
@@ -23,25 +27,16 @@ def create_monthly_heatmap(df: pd.DataFrame) -> go.Figure:
     if 'year' not in df.columns or 'month_name' not in df.columns:
         return go.Figure()
     
-    monthly_data = df.groupby(['year', 'month_name'])['amount'].sum().reset_index()
-    
-    # Pivot for heatmap
-    heatmap_data = monthly_data.pivot(index='month_name', columns='year', values='amount')
-    
-    # Order months correctly
-    month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                   'July', 'August', 'September', 'October', 'November', 'December']
-    heatmap_data = heatmap_data.reindex([m for m in month_order if m in heatmap_data.index])
-    
-    colors = get_theme_colors()
+    # month_name is categorical in calendar order, so rows come out ordered
+    monthly_data = aggregate_amounts(df, ['year', 'month_name'])['sum']
+    heatmap_data = monthly_data.unstack('year')
     
     fig = go.Figure(data=go.Heatmap(
         z=heatmap_data.values,
         x=heatmap_data.columns,
         y=heatmap_data.index,
         colorscale='YlOrRd',
-        text=heatmap_data.values,
-        texttemplate='%{text:,.0f}',
+        texttemplate='%{z:,.0f}',
         textfont={"size": 10},
         hovertemplate='Year: %{x}<br>Month: %{y}<br>Amount: AED %{z:,.0f}<extra></extra>'
     ))
@@ -57,6 +52,7 @@ def create_monthly_heatmap(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@cache_figure
 def create_hourly_pattern(df: pd.DataFrame) -> go.Figure:
     """
     Create hourly donation pattern chart.
@@ -70,20 +66,15 @@ def create_hourly_pattern(df: pd.DataFrame) -> go.Figure:
     if 'hour' not in df.columns:
         return go.Figure()
     
-    hourly_data = df.groupby('hour').agg({
-        'amount': 'sum',
-        'id': 'count'
-    }).reset_index()
-    
-    hourly_data.columns = ['hour', 'total_amount', 'count']
+    hourly_data = aggregate_amounts(df, 'hour')
     
     colors = get_theme_colors()
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=hourly_data['hour'],
-        y=hourly_data['total_amount'],
+        x=hourly_data.index,
+        y=hourly_data['sum'],
         marker_color=colors['primary'],
         name='Total Amount',
         hovertemplate='Hour: %{x}<br>Amount: AED %{y:,.0f}<extra></extra>'
@@ -102,6 +93,7 @@ def create_hourly_pattern(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@cache_figure
 def create_weekday_pattern(df: pd.DataFrame) -> go.Figure:
     """
     Create weekday donation pattern chart.
@@ -115,27 +107,19 @@ def create_weekday_pattern(df: pd.DataFrame) -> go.Figure:
     if 'weekday' not in df.columns:
         return go.Figure()
     
-    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
-    weekday_data = df.groupby('weekday').agg({
-        'amount': ['sum', 'mean'],
-        'id': 'count'
-    }).reset_index()
-    
-    weekday_data.columns = ['weekday', 'total_amount', 'avg_amount', 'count']
-    weekday_data['weekday'] = pd.Categorical(weekday_data['weekday'], categories=weekday_order, ordered=True)
-    weekday_data = weekday_data.sort_values('weekday')
+    # weekday is categorical Monday..Sunday, so groups come out in week order
+    weekday_data = aggregate_amounts(df, 'weekday')
     
     colors = get_chart_colors()
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=weekday_data['weekday'],
-        y=weekday_data['total_amount'],
+        x=weekday_data.index,
+        y=weekday_data['sum'],
         marker_color=colors[1],
         name='Total Amount',
-        text=weekday_data['total_amount'].apply(lambda x: f'AED {x:,.0f}'),
+        texttemplate='AED %{y:,.0f}',
         textposition='outside',
         hovertemplate='<b>%{x}</b><br>Total: AED %{y:,.0f}<br>Count: %{customdata:,}<extra></extra>',
         customdata=weekday_data['count']
@@ -152,6 +136,7 @@ def create_weekday_pattern(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@cache_figure
 def create_time_weekday_heatmap(df: pd.DataFrame) -> go.Figure:
     """
     Create hour x weekday heatmap.
@@ -165,16 +150,16 @@ def create_time_weekday_heatmap(df: pd.DataFrame) -> go.Figure:
     if 'hour' not in df.columns or 'weekday' not in df.columns:
         return go.Figure()
     
-    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
-    heatmap_data = df.groupby(['weekday', 'hour'])['amount'].sum().reset_index()
-    heatmap_pivot = heatmap_data.pivot(index='weekday', columns='hour', values='amount').fillna(0)
-    heatmap_pivot = heatmap_pivot.reindex([d for d in weekday_order if d in heatmap_pivot.index])
+    # Scatter-add amounts into a fixed 7 x 24 grid using the weekday codes
+    # and hours as cell coordinates, instead of a groupby + unstack
+    weekdays = df['weekday'].cat.categories
+    cells = df['weekday'].cat.codes.to_numpy(dtype=np.intp) * 24 + df['hour'].to_numpy(dtype=np.intp)
+    grid = np.bincount(cells, weights=df['amount'].to_numpy(), minlength=len(weekdays) * 24)
     
     fig = go.Figure(data=go.Heatmap(
-        z=heatmap_pivot.values,
-        x=heatmap_pivot.columns,
-        y=heatmap_pivot.index,
+        z=grid.reshape(len(weekdays), 24).astype(np.float32),
+        x=np.arange(24),
+        y=weekdays,
         colorscale='Viridis',
         hovertemplate='Day: %{y}<br>Hour: %{x}<br>Amount: AED %{z:,.0f}<extra></extra>'
     ))
@@ -190,6 +175,7 @@ def create_time_weekday_heatmap(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@cache_figure
 def create_yearly_monthly_analysis(df: pd.DataFrame) -> go.Figure:
     """
     Create year-over-year monthly comparison.
@@ -203,10 +189,8 @@ def create_yearly_monthly_analysis(df: pd.DataFrame) -> go.Figure:
     if 'year' not in df.columns or 'month_name' not in df.columns:
         return go.Figure()
     
-    monthly_yearly = df.groupby(['year', 'month_name'])['amount'].sum().reset_index()
-    
-    month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                   'July', 'August', 'September', 'October', 'November', 'December']
+    # Rows are ordered by year, then calendar month (month_name is categorical)
+    monthly_yearly = aggregate_amounts(df, ['year', 'month_name'])['sum'].reset_index(name='amount')
     
     colors = get_chart_colors()
     
@@ -214,8 +198,6 @@ def create_yearly_monthly_analysis(df: pd.DataFrame) -> go.Figure:
     
     for idx, year in enumerate(sorted(monthly_yearly['year'].unique())):
         year_data = monthly_yearly[monthly_yearly['year'] == year]
-        year_data['month_name'] = pd.Categorical(year_data['month_name'], categories=month_order, ordered=True)
-        year_data = year_data.sort_values('month_name')
         
         fig.add_trace(go.Scatter(
             x=year_data['month_name'],
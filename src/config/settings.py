@@ -22,6 +22,8 @@ INITIAL_SIDEBAR_STATE = "expanded"
 DATA_DIR = Path('data')
 DATA_PATH = DATA_DIR / 'General_Donation_Processed.csv'
 RAW_DATA_PATH = DATA_DIR / 'General_Donation.csv'
+HIJRI_LOOKUP_PATH = DATA_DIR / 'hijri_lookup.parquet'
+CSV_CHUNK_SIZE = 500_000  # Rows parsed per chunk when reading CSV files
 
 # ============================================================================
 # CHART SETTINGS
@@ -39,6 +41,8 @@ TOP_N_DONORS = 10
 
 CACHE_TTL = 3600  # 1 hour in seconds
 DATA_CACHE_TTL = 1800  # 30 minutes in seconds
+FILTER_CACHE_MAX_ENTRIES = 32  # filtered frames kept per filter selection
+AGGREGATE_CACHE_MAX_ENTRIES = 512  # grouped aggregates kept per function
 
 # ============================================================================
 # DATE FORMATS
@@ -22,6 +22,13 @@ THEME = {
     'shadow': 'rgba(0, 0, 0, 0.1)',
 }
 
+# RGB components of each hex theme color, parsed once for translucent fills
+THEME_RGB = {
+    name: tuple(int(value[i:i + 2], 16) for i in (1, 3, 5))
+    for name, value in THEME.items()
+    if value.startswith('#')
+}
+
 # ============================================================================
 # CHART COLOR PALETTE
 # ============================================================================
@@ -46,3 +53,8 @@ def get_chart_colors() -> list:
 def get_plot_template() -> str:
     """Get plotly template."""
     return 'plotly_white'
+
+def get_rgba(name: str, alpha: float) -> str:
+    """Get a theme color as an rgba() string with the given opacity."""
+    r, g, b = THEME_RGB[name]
+    return f"rgba({r}, {g}, {b}, {alpha})"
@@ -1,7 +1,22 @@
 """Pages module for dashboard sections."""
 
-from .overview import render_overview_page
-from .ramadan import render_ramadan_page
-from .temporal import render_temporal_page
-from .donors import render_donors_page
-from .comparison import render_comparison_page
+import importlib
+
+# Page renderers are resolved on first access so importing one page does not
+# pull in the plotting dependencies of every other page.
+_RENDERERS = {
+    'render_overview_page': '.overview',
+    'render_ramadan_page': '.ramadan',
+    'render_temporal_page': '.temporal',
+    'render_donors_page': '.donors',
+    'render_comparison_page': '.comparison',
+}
+
+__all__ = list(_RENDERERS)
+
+
+def __getattr__(name):
+    if name in _RENDERERS:
+        module = importlib.import_module(_RENDERERS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,13 @@ Compare donations between different time periods
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
-from ..services.data_service import filter_data_by_date_range, filter_data_by_categories, get_unique_categories
+from functools import partial
+from ..services.data_service import (
+    filter_data,
+    get_date_range,
+    get_unique_categories,
+    export_to_csv
+)
 from ..services.metrics_service import compare_periods
 from ..components.kpi_cards import display_comparison_metrics
 from ..components.category_charts import create_category_bar_chart
@@ -30,8 +36,7 @@ def render_comparison_page(df: pd.DataFrame):
     """)
     
     # Get date range from data
-    min_date = df['donationdate'].min().date()
-    max_date = df['donationdate'].max().date()
+    min_date, max_date = get_date_range(df)
     
     # Period Selection
     st.header("Select Periods to Compare")
@@ -107,14 +112,8 @@ def render_comparison_page(df: pd.DataFrame):
         return
     
     # Filter data
-    df1 = filter_data_by_date_range(df, period1_start, period1_end)
-    df2 = filter_data_by_date_range(df, period2_start, period2_end)
-    
-    if period1_categories:
-        df1 = filter_data_by_categories(df1, period1_categories)
-    
-    if period2_categories:
-        df2 = filter_data_by_categories(df2, period2_categories)
+    df1 = filter_data(df, period1_start, period1_end, period1_categories)
+    df2 = filter_data(df, period2_start, period2_end, period2_categories)
     
     if df1.empty:
         st.warning("Period 1: No data found for the selected filters")
@@ -241,17 +240,42 @@ def render_comparison_page(df: pd.DataFrame):
             st.info("No data for this period")
     
     # Export Comparison
+    _render_export_section(df1, df2, f"{period1_start}_to_{period1_end}", f"{period2_start}_to_{period2_end}")
+
+
+@st.fragment
+def _render_export_section(
+    df1: pd.DataFrame,
+    df2: pd.DataFrame,
+    period1_suffix: str,
+    period2_suffix: str
+):
+    """
+    Render the comparison data export section.
+    
+    Runs as a fragment so download clicks rerun only this section instead
+    of rebuilding every chart on the page. CSV files are generated only
+    when a download button is clicked rather than embedded on every run.
+    
+    Args:
+        df1: DataFrame for period 1
+        df2: DataFrame for period 2
+        period1_suffix: File name suffix for period 1
+        period2_suffix: File name suffix for period 2
+    """
     with st.expander(":material/download: Export Comparison Data"):
         st.download_button(
             label="Download Period 1 Data",
-            data=df1.to_csv(index=False).encode('utf-8'),
-            file_name=f"period1_{period1_start}_to_{period1_end}.csv",
-            mime="text/csv"
+            data=partial(export_to_csv, df1),
+            file_name=f"period1_{period1_suffix}.csv",
+            mime="text/csv",
+            on_click="ignore"
         )
         
         st.download_button(
             label="Download Period 2 Data",
-            data=df2.to_csv(index=False).encode('utf-8'),
-            file_name=f"period2_{period2_start}_to_{period2_end}.csv",
-            mime="text/csv"
+            data=partial(export_to_csv, df2),
+            file_name=f"period2_{period2_suffix}.csv",
+            mime="text/csv",
+            on_click="ignore"
         )
@@ -7,6 +7,7 @@ import streamlit as st
 import pandas as pd
 from ..services.metrics_service import calculate_donor_statistics, get_top_donors
 from ..components.donor_charts import create_top_donors_chart
+from ..utils.format_utils import format_aed
 
 
 def render_donors_page(df: pd.DataFrame):
@@ -54,6 +55,43 @@ def render_donors_page(df: pd.DataFrame):
     # Top Donors
     st.header("Top Donors")
     
+    _render_top_donors(df)
+    
+    st.divider()
+    
+    # Donor Deep Dive
+    with st.expander(":material/search: Donor Deep Dive"):
+        st.subheader("Donor Statistics by Category")
+        
+        if 'donationtype' in df.columns:
+            column = 'donationtype_en' if 'donationtype_en' in df.columns else 'donationtype'
+            
+            # Named aggregations produce flat columns, with no MultiIndex to build
+            category_donor_stats = df.groupby(column, observed=True).agg(
+                unique_donors=('id', 'nunique'),
+                total_amount=('amount', 'sum'),
+                avg_amount=('amount', 'mean'),
+                donations=('amount', 'size')
+            ).reset_index()
+            
+            category_donor_stats.columns = ['Category', 'Unique Donors', 'Total Amount', 'Avg Amount', 'Donations']
+            category_donor_stats['Avg Amount'] = format_aed(category_donor_stats['Avg Amount'])
+            category_donor_stats['Total Amount'] = format_aed(category_donor_stats['Total Amount'])
+            category_donor_stats = category_donor_stats.sort_values('Unique Donors', ascending=False)
+            
+            st.dataframe(category_donor_stats.head(15), use_container_width=True, hide_index=True)
+
+
+@st.fragment
+def _render_top_donors(df: pd.DataFrame):
+    """
+    Render the top donors chart, its details table and the top-N slider.
+    
+    Runs as a fragment so moving the slider reruns only this section.
+    
+    Args:
+        df: Input DataFrame
+    """
     top_n = st.slider("Number of top donors to show", 5, 50, 10, key="top_donors_slider")
     
     fig = create_top_donors_chart(df, top_n)
@@ -66,31 +104,10 @@ def render_donors_page(df: pd.DataFrame):
         if not top_donors_df.empty:
             top_donors_df['rank'] = range(1, len(top_donors_df) + 1)
             top_donors_df['donor_id'] = top_donors_df['donor_id'].apply(lambda x: f"Donor {hash(x) % 10000}")
-            top_donors_df['total_amount'] = top_donors_df['total_amount'].apply(lambda x: f"AED {x:,.2f}")
-            top_donors_df['avg_amount'] = top_donors_df['avg_amount'].apply(lambda x: f"AED {x:,.2f}")
+            top_donors_df['total_amount'] = format_aed(top_donors_df['total_amount'])
+            top_donors_df['avg_amount'] = format_aed(top_donors_df['avg_amount'])
             
             display_df = top_donors_df[['rank', 'donor_id', 'total_amount', 'donation_count', 'avg_amount']]
             display_df.columns = ['Rank', 'Donor', 'Total Amount', 'Donations', 'Avg Amount']
             
             st.dataframe(display_df, use_container_width=True, hide_index=True)
-    
-    st.divider()
-    
-    # Donor Deep Dive
-    with st.expander(":material/search: Donor Deep Dive"):
-        st.subheader("Donor Statistics by Category")
-        
-        if 'donationtype' in df.columns:
-            column = 'donationtype_en' if 'donationtype_en' in df.columns else 'donationtype'
-            
-            category_donor_stats = df.groupby(column).agg({
-                'id': 'nunique',
-                'amount': ['sum', 'mean', 'count']
-            }).reset_index()
-            
-            category_donor_stats.columns = ['Category', 'Unique Donors', 'Total Amount', 'Avg Amount', 'Donations']
-            category_donor_stats['Avg Amount'] = category_donor_stats['Avg Amount'].apply(lambda x: f"AED {x:,.2f}")
-            category_donor_stats['Total Amount'] = category_donor_stats['Total Amount'].apply(lambda x: f"AED {x:,.2f}")
-            category_donor_stats = category_donor_stats.sort_values('Unique Donors', ascending=False)
-            
-            st.dataframe(category_donor_stats.head(15), use_container_width=True, hide_index=True)
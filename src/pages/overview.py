@@ -5,6 +5,7 @@ Main dashboard overview with key metrics and trends
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from ..services.metrics_service import calculate_kpis, calculate_growth_rate
 from ..components.kpi_cards import display_kpi_cards, display_ramadan_kpis
 from ..components.time_series_charts import (
@@ -43,17 +44,18 @@ def render_overview_page(df: pd.DataFrame):
     kpis = calculate_kpis(df)
     display_kpi_cards(kpis)
     
-    # Additional Data Summary Metrics
+    # Additional Data Summary Metrics, read from the cached KPIs instead of
+    # scanning the amounts again on every rerun
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Max Donation", f"AED {df['amount'].max():,.0f}")
+        st.metric("Max Donation", f"AED {kpis['max_donation']:,.0f}")
     
     with col2:
-        st.metric("Median Donation", f"AED {df['amount'].median():,.0f}")
+        st.metric("Median Donation", f"AED {kpis['median_donation']:,.0f}")
     
     with col3:
-        st.metric("Std Deviation", f"AED {df['amount'].std():,.0f}")
+        st.metric("Std Deviation", f"AED {kpis['std_donation']:,.0f}")
     
     # Growth metrics
     st.subheader("Growth Metrics")
@@ -97,26 +99,14 @@ def render_overview_page(df: pd.DataFrame):
         st.plotly_chart(fig, use_container_width=True)
     
     with tab3:
-        window = st.slider("Moving Average Window (days)", 3, 30, 7)
-        fig = create_moving_average_chart(df, window)
-        st.plotly_chart(fig, use_container_width=True)
+        _render_moving_average(df)
     
     st.divider()
     
     # Category Analysis
     st.header("Category Analysis")
     
-    top_n = st.slider("Number of categories to show", 5, 20, 10, key="category_slider")
-    
-    tab1, tab2 = st.tabs(["Distribution Chart", "Bar Chart"])
-    
-    with tab1:
-        fig = create_category_distribution(df, top_n)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with tab2:
-        fig = create_category_bar_chart(df, top_n)
-        st.plotly_chart(fig, use_container_width=True)
+    _render_category_analysis(df)
     
     st.divider()
     
@@ -129,12 +119,9 @@ def render_overview_page(df: pd.DataFrame):
         # Donation size segments
         bins = [0, 100, 500, 1000, 5000, 10000, float('inf')]
         labels = ['Under 100', '100-500', '500-1K', '1K-5K', '5K-10K', 'Above 10K']
-        df_temp = df.copy()
-        df_temp['size_segment'] = pd.cut(df_temp['amount'], bins=bins, labels=labels)
+        size_segment = pd.cut(df['amount'], bins=bins, labels=labels)
         
-        size_stats = df_temp.groupby('size_segment', observed=True).agg({
-            'amount': ['count', 'sum']
-        }).reset_index()
+        size_stats = df['amount'].groupby(size_segment, observed=True).agg(['size', 'sum']).reset_index()
         size_stats.columns = ['Segment', 'Count', 'Total']
         size_stats['Avg'] = (size_stats['Total'] / size_stats['Count']).round(2)
         size_stats['% of Donations'] = (size_stats['Count'] / len(df) * 100).round(1)
@@ -150,19 +137,21 @@ def render_overview_page(df: pd.DataFrame):
     with col2:
         # Key insights
         st.subheader("Key Insights")
-        small_donations = df[df['amount'] < 500]
-        large_donations = df[df['amount'] >= 5000]
+        # Count and sum through masks instead of materializing filtered frames
+        amounts = df['amount'].to_numpy()
+        small_count = int(np.count_nonzero(amounts < 500))
+        large_mask = amounts >= 5000
         
         st.metric(
             "Small Donations (<500 AED)",
-            f"{len(small_donations):,}",
-            f"{len(small_donations)/len(df)*100:.1f}% of total"
+            f"{small_count:,}",
+            f"{small_count/len(df)*100:.1f}% of total"
         )
         
         st.metric(
             "Large Donations (≥5,000 AED)",
-            f"{len(large_donations):,}",
-            f"{large_donations['amount'].sum()/df['amount'].sum()*100:.1f}% of amount"
+            f"{int(np.count_nonzero(large_mask)):,}",
+            f"{amounts[large_mask].sum()/amounts.sum()*100:.1f}% of amount"
         )
         
         # Concentration metric
@@ -173,3 +162,41 @@ def render_overview_page(df: pd.DataFrame):
             f"{concentration:.1f}%",
             "of amount from top 20% donations"
         )
+
+
+@st.fragment
+def _render_moving_average(df: pd.DataFrame):
+    """
+    Render the moving average chart and its window slider.
+    
+    Runs as a fragment so moving the slider reruns only this chart.
+    
+    Args:
+        df: Input DataFrame
+    """
+    window = st.slider("Moving Average Window (days)", 3, 30, 7)
+    fig = create_moving_average_chart(df, window)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def _render_category_analysis(df: pd.DataFrame):
+    """
+    Render the category charts and their top-N slider.
+    
+    Runs as a fragment so moving the slider reruns only these charts.
+    
+    Args:
+        df: Input DataFrame
+    """
+    top_n = st.slider("Number of categories to show", 5, 20, 10, key="category_slider")
+    
+    tab1, tab2 = st.tabs(["Distribution Chart", "Bar Chart"])
+    
+    with tab1:
+        fig = create_category_distribution(df, top_n)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with tab2:
+        fig = create_category_bar_chart(df, top_n)
+        st.plotly_chart(fig, use_container_width=True)
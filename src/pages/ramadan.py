@@ -5,13 +5,16 @@ Detailed analysis of Ramadan donation patterns
 
 import streamlit as st
 import pandas as pd
-from ..services.metrics_service import calculate_kpis
+import numpy as np
+from ..services.metrics_service import calculate_kpis, aggregate_amounts
 from ..components.kpi_cards import display_ramadan_kpis
 from ..components.ramadan_charts import (
     create_ramadan_comparison_chart,
     create_islamic_events_chart,
     create_hijri_months_chart
 )
+from ..utils.hijri_calendar import hijri_month_names
+from ..utils.format_utils import format_aed
 
 
 def render_ramadan_page(df: pd.DataFrame):
@@ -56,11 +59,8 @@ def render_ramadan_page(df: pd.DataFrame):
     # Key insights
     st.subheader(":material/search: Key Insights")
     
-    ramadan_df = df[df['is_ramadan'] == True]
-    non_ramadan_df = df[df['is_ramadan'] == False]
-    
-    ramadan_avg = ramadan_df['amount'].mean()
-    non_ramadan_avg = non_ramadan_df['amount'].mean()
+    ramadan_avg = kpis['ramadan_avg']
+    non_ramadan_avg = kpis['non_ramadan_avg']
     increase = ((ramadan_avg - non_ramadan_avg) / non_ramadan_avg * 100) if non_ramadan_avg > 0 else 0
     
     col1, col2, col3 = st.columns(3)
@@ -74,16 +74,16 @@ def render_ramadan_page(df: pd.DataFrame):
         """)
     
     with col2:
-        ramadan_pct = (len(ramadan_df) / len(df) * 100)
+        ramadan_pct = kpis['ramadan_percentage']
         st.info(f"""
         **Donation Concentration**
         
         **{ramadan_pct:.1f}%** of all donations occur during Ramadan, 
-        representing **{len(ramadan_df):,}** donations.
+        representing **{kpis['ramadan_donations']:,}** donations.
         """)
     
     with col3:
-        ramadan_amount_pct = (ramadan_df['amount'].sum() / df['amount'].sum() * 100)
+        ramadan_amount_pct = (kpis['ramadan_amount'] / kpis['total_amount'] * 100)
         st.info(f"""
         **Financial Impact**
         
@@ -106,13 +106,13 @@ def render_ramadan_page(df: pd.DataFrame):
         
         column = 'donationtype_en' if 'donationtype_en' in df.columns else 'donationtype'
         
-        ramadan_cats = ramadan_df.groupby(column)['amount'].agg(['sum', 'count']).reset_index()
-        non_ramadan_cats = non_ramadan_df.groupby(column)['amount'].agg(['sum', 'count']).reset_index()
-        
-        ramadan_cats.columns = ['Category', 'Ramadan_Amount', 'Ramadan_Count']
-        non_ramadan_cats.columns = ['Category', 'NonRamadan_Amount', 'NonRamadan_Count']
+        # One grouping over (category, Ramadan flag), split into two columns per side
+        category_stats = aggregate_amounts(df, [column, 'is_ramadan'])[['sum', 'count']]
+        comparison = category_stats.unstack('is_ramadan', fill_value=0)
+        comparison = comparison.reindex(columns=pd.MultiIndex.from_product([['sum', 'count'], [True, False]]), fill_value=0)
+        comparison.columns = ['Ramadan_Amount', 'NonRamadan_Amount', 'Ramadan_Count', 'NonRamadan_Count']
+        comparison = comparison.rename_axis('Category').reset_index()
         
-        comparison = pd.merge(ramadan_cats, non_ramadan_cats, on='Category', how='outer').fillna(0)
         comparison['Ramadan_Avg'] = comparison['Ramadan_Amount'] / comparison['Ramadan_Count'].replace(0, 1)
         comparison['NonRamadan_Avg'] = comparison['NonRamadan_Amount'] / comparison['NonRamadan_Count'].replace(0, 1)
         comparison['Increase_%'] = ((comparison['Ramadan_Avg'] - comparison['NonRamadan_Avg']) / comparison['NonRamadan_Avg'].replace(0, 1) * 100).round(1)
@@ -130,21 +130,17 @@ def render_ramadan_page(df: pd.DataFrame):
     if 'islamic_event' in df.columns:
         st.header("Donations During Islamic Events")
         
-        events_df = df[df['islamic_event'].notna()]
+        event_stats = aggregate_amounts(df, 'islamic_event').reset_index()
         
-        if not events_df.empty:
+        if not event_stats.empty:
             fig = create_islamic_events_chart(df)
             st.plotly_chart(fig, use_container_width=True)
             
             # Event details table
             with st.expander(":material/analytics: Islamic Events Details"):
-                event_stats = events_df.groupby('islamic_event').agg({
-                    'amount': ['sum', 'mean', 'count']
-                }).reset_index()
-                
                 event_stats.columns = ['Event', 'Total Amount', 'Avg Amount', 'Count']
-                event_stats['Total Amount'] = event_stats['Total Amount'].apply(lambda x: f"AED {x:,.2f}")
-                event_stats['Avg Amount'] = event_stats['Avg Amount'].apply(lambda x: f"AED {x:,.2f}")
+                event_stats['Total Amount'] = format_aed(event_stats['Total Amount'])
+                event_stats['Avg Amount'] = format_aed(event_stats['Avg Amount'])
                 
                 st.dataframe(event_stats, use_container_width=True, hide_index=True)
         else:
@@ -153,24 +149,23 @@ def render_ramadan_page(df: pd.DataFrame):
     st.divider()
     
     # Hijri Calendar Analysis
-    if 'hijri_month_name' in df.columns:
+    if 'hijri_month' in df.columns:
         st.header("Donations by Hijri Month")
         
-        hijri_df = df[df['hijri_month_name'].notna()]
+        hijri_stats = aggregate_amounts(df, 'hijri_month')
         
-        if not hijri_df.empty:
+        if not hijri_stats.empty:
             fig = create_hijri_months_chart(df)
             st.plotly_chart(fig, use_container_width=True)
             
             # Hijri month details
             with st.expander(":material/analytics: Hijri Month Details"):
-                hijri_stats = hijri_df.groupby('hijri_month_name').agg({
-                    'amount': ['sum', 'mean', 'count']
-                }).reset_index()
+                hijri_stats.index = hijri_month_names(hijri_stats.index.to_series())
+                hijri_stats = hijri_stats.reset_index()
                 
                 hijri_stats.columns = ['Hijri Month', 'Total Amount', 'Avg Amount', 'Count']
-                hijri_stats['Total Amount'] = hijri_stats['Total Amount'].apply(lambda x: f"AED {x:,.2f}")
-                hijri_stats['Avg Amount'] = hijri_stats['Avg Amount'].apply(lambda x: f"AED {x:,.2f}")
+                hijri_stats['Total Amount'] = format_aed(hijri_stats['Total Amount'])
+                hijri_stats['Avg Amount'] = format_aed(hijri_stats['Avg Amount'])
                 hijri_stats = hijri_stats.sort_values('Count', ascending=False)
                 
                 st.dataframe(hijri_stats, use_container_width=True, hide_index=True)
@@ -181,18 +176,25 @@ def render_ramadan_page(df: pd.DataFrame):
     with st.expander(":material/search: Ramadan Data Explorer"):
         st.subheader("Ramadan Donations Sample")
         
+        # Only the first 100 Ramadan rows are shown, so take just those rows
+        # instead of materializing every Ramadan donation
+        ramadan_rows = np.flatnonzero(df['is_ramadan'].to_numpy())
+        sample_rows = df.iloc[ramadan_rows[:100]]
+        
         display_cols = ['donationdate', 'amount', 'donationtype']
-        if 'donationtype_en' in ramadan_df.columns:
+        if 'donationtype_en' in df.columns:
             display_cols.append('donationtype_en')
-        if 'hijri_month_name' in ramadan_df.columns:
-            display_cols.append('hijri_month_name')
         
-        available_cols = [col for col in display_cols if col in ramadan_df.columns]
+        available_cols = [col for col in display_cols if col in df.columns]
+        sample_df = sample_rows[available_cols]
+        
+        if 'hijri_month' in df.columns:
+            sample_df = sample_df.assign(hijri_month_name=hijri_month_names(sample_rows['hijri_month']))
         
         st.dataframe(
-            ramadan_df[available_cols].head(100),
+            sample_df,
             use_container_width=True,
             hide_index=True
         )
         
-        st.caption(f"Showing first 100 of {len(ramadan_df):,} Ramadan donations")
+        st.caption(f"Showing first 100 of {len(ramadan_rows):,} Ramadan donations")
@@ -5,6 +5,7 @@ Detailed temporal patterns and trends
 
 import streamlit as st
 import pandas as pd
+from ..services.metrics_service import aggregate_amounts, calculate_daily_totals
 from ..components.temporal_charts import (
     create_monthly_heatmap,
     create_hourly_pattern,
@@ -12,6 +13,7 @@ from ..components.temporal_charts import (
     create_time_weekday_heatmap,
     create_yearly_monthly_analysis
 )
+from ..utils.format_utils import format_aed
 
 
 def render_temporal_page(df: pd.DataFrame):
@@ -35,12 +37,14 @@ def render_temporal_page(df: pd.DataFrame):
     # Donation Peaks Analysis
     st.header("Donation Peaks & Trends")
     
+    daily_amounts = calculate_daily_totals(df).set_index('date')['amount']
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         # Best day
-        best_day = df.groupby('date')['amount'].sum().idxmax()
-        best_day_amount = df.groupby('date')['amount'].sum().max()
+        best_day = daily_amounts.idxmax()
+        best_day_amount = daily_amounts.max()
         st.metric(
             "Best Single Day",
             f"{best_day.strftime('%Y-%m-%d')}",
@@ -50,20 +54,19 @@ def render_temporal_page(df: pd.DataFrame):
     with col2:
         # Best month
         if 'year' in df.columns and 'month' in df.columns:
-            df_temp = df.copy()
-            df_temp['year_month'] = df_temp['year'].astype(str) + '-' + df_temp['month'].astype(str).str.zfill(2)
-            best_month = df_temp.groupby('year_month')['amount'].sum().idxmax()
-            best_month_amount = df_temp.groupby('year_month')['amount'].sum().max()
+            monthly_amounts = aggregate_amounts(df, ['year', 'month'])['sum']
+            best_year, best_month = monthly_amounts.idxmax()
+            best_month_amount = monthly_amounts.max()
             st.metric(
                 "Best Month",
-                best_month,
+                f"{best_year}-{best_month:02d}",
                 f"AED {best_month_amount:,.0f}"
             )
     
     with col3:
         # Average daily donation
-        avg_daily = df.groupby('date')['amount'].sum().mean()
-        std_daily = df.groupby('date')['amount'].sum().std()
+        avg_daily = daily_amounts.mean()
+        std_daily = daily_amounts.std()
         cv = (std_daily / avg_daily * 100) if avg_daily > 0 else 0
         st.metric(
             "Daily Consistency",
@@ -96,9 +99,7 @@ def render_temporal_page(df: pd.DataFrame):
         with st.expander(":material/wb_sunny: Seasonal Trends"):
             if 'quarter' in df.columns:
                 st.subheader("Quarterly Performance")
-                quarterly = df.groupby('quarter').agg({
-                    'amount': ['sum', 'mean', 'count']
-                }).reset_index()
+                quarterly = aggregate_amounts(df, 'quarter').reset_index()
                 quarterly.columns = ['Quarter', 'Total', 'Average', 'Count']
                 
                 col1, col2 = st.columns(2)
@@ -111,8 +112,8 @@ def render_temporal_page(df: pd.DataFrame):
                     worst_q = quarterly.loc[quarterly['Total'].idxmin()]
                     st.warning(f"**Weakest Quarter:** Q{int(worst_q['Quarter'])}\n\nTotal: AED {worst_q['Total']:,.0f}")
                 
-                quarterly['Total'] = quarterly['Total'].apply(lambda x: f"AED {x:,.2f}")
-                quarterly['Average'] = quarterly['Average'].apply(lambda x: f"AED {x:,.2f}")
+                quarterly['Total'] = format_aed(quarterly['Total'])
+                quarterly['Average'] = format_aed(quarterly['Average'])
                 st.dataframe(quarterly, use_container_width=True, hide_index=True)
     else:
         st.warning("Year and month data not available.")
@@ -135,9 +136,7 @@ def render_temporal_page(df: pd.DataFrame):
     with col2:
         st.subheader("Busiest Days")
         if 'weekday' in df.columns:
-            weekday_stats = df.groupby('weekday').agg({
-                'amount': ['sum', 'mean', 'count']
-            }).reset_index()
+            weekday_stats = aggregate_amounts(df, 'weekday').reset_index()
             weekday_stats.columns = ['Day', 'Total', 'Average', 'Count']
             
             busiest = weekday_stats.nlargest(1, 'Total')['Day'].values[0]
@@ -161,7 +160,7 @@ def render_temporal_page(df: pd.DataFrame):
         
         # Hourly insights
         with st.expander(":material/access_time: Hourly Insights"):
-            hourly_stats = df.groupby('hour')['amount'].agg(['sum', 'mean', 'count']).reset_index()
+            hourly_stats = aggregate_amounts(df, 'hour').reset_index()
             hourly_stats.columns = ['Hour', 'Total Amount', 'Avg Amount', 'Count']
             
             peak_hour = int(hourly_stats.nlargest(1, 'Total Amount')['Hour'].values[0])
@@ -195,22 +194,18 @@ def render_temporal_page(df: pd.DataFrame):
     with st.expander(":material/analytics: Temporal Statistics Summary"):
         if 'year' in df.columns:
             st.subheader("Yearly Statistics")
-            yearly_stats = df.groupby('year').agg({
-                'amount': ['sum', 'mean', 'count']
-            }).reset_index()
+            yearly_stats = aggregate_amounts(df, 'year').reset_index()
             yearly_stats.columns = ['Year', 'Total Amount', 'Avg Amount', 'Count']
-            yearly_stats['Total Amount'] = yearly_stats['Total Amount'].apply(lambda x: f"AED {x:,.2f}")
-            yearly_stats['Avg Amount'] = yearly_stats['Avg Amount'].apply(lambda x: f"AED {x:,.2f}")
+            yearly_stats['Total Amount'] = format_aed(yearly_stats['Total Amount'])
+            yearly_stats['Avg Amount'] = format_aed(yearly_stats['Avg Amount'])
             
             st.dataframe(yearly_stats, use_container_width=True, hide_index=True)
         
         if 'quarter' in df.columns:
             st.subheader("Quarterly Statistics")
-            quarterly_stats = df.groupby(['year', 'quarter']).agg({
-                'amount': ['sum', 'mean', 'count']
-            }).reset_index()
+            quarterly_stats = aggregate_amounts(df, ['year', 'quarter']).reset_index()
             quarterly_stats.columns = ['Year', 'Quarter', 'Total Amount', 'Avg Amount', 'Count']
-            quarterly_stats['Total Amount'] = quarterly_stats['Total Amount'].apply(lambda x: f"AED {x:,.2f}")
-            quarterly_stats['Avg Amount'] = quarterly_stats['Avg Amount'].apply(lambda x: f"AED {x:,.2f}")
+            quarterly_stats['Total Amount'] = format_aed(quarterly_stats['Total Amount'])
+            quarterly_stats['Avg Amount'] = format_aed(quarterly_stats['Avg Amount'])
             
             st.dataframe(quarterly_stats.tail(12), use_container_width=True, hide_index=True)
@@ -3,27 +3,90 @@ Data Service
 Handles all data loading, processing, and transformation
 """
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from pathlib import Path
 from typing import Optional
-from ..config.settings import DATA_PATH, RAW_DATA_PATH, DATA_CACHE_TTL
+from ..config.settings import (
+    DATA_PATH,
+    RAW_DATA_PATH,
+    HIJRI_LOOKUP_PATH,
+    DATA_CACHE_TTL,
+    FILTER_CACHE_MAX_ENTRIES,
+    CSV_CHUNK_SIZE
+)
+from ..utils.date_utils import add_time_dimensions
+from ..utils.hijri_calendar import build_hijri_lookup
+from ..utils.cache_utils import FRAME_HASH_FUNCS
 
+# Columns read from the donation CSVs; calendar columns are derived on load
+PROCESSED_COLUMNS = ['id', 'donationdate', 'amount', 'donationtype', 'donationtype_en']
+RAW_COLUMNS = ['id', 'donationdate', 'amount', 'donationtype']
 
-@st.cache_data(ttl=DATA_CACHE_TTL)
-def load_data(file_path: Optional[Path] = None) -> pd.DataFrame:
+# Stored in the Feather cache's schema metadata; bump it whenever the
+# processed columns or dtypes change so existing caches are rebuilt
+FEATHER_CACHE_VERSION = b'2'
+
+CSV_DTYPES = {
+    'id': 'Int64',
+    'amount': 'float32',
+    'donationtype': 'category',
+    'donationtype_en': 'category',
+}
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORY_COLUMNS = [
+    'donationtype', 'donationtype_en', 'month_name', 'weekday',
+    'ramadan_period', 'islamic_event'
+]
+
+
+def load_data(file_path: Path = DATA_PATH) -> pd.DataFrame:
     """
     Load preprocessed donation data with caching.
     
+    The cache is shared across reruns and sessions and is keyed on the
+    file's path and the modification times of the file and the Hijri
+    lookup table, so regenerating either reloads the data on the next
+    rerun. The same DataFrame object is returned on every
+    rerun instead of an unpickled copy, so callers must treat it as
+    read-only.
+    
     Args:
-        file_path: Path to the data file. If None, uses default DATA_PATH
+        file_path: Path to the data file. Defaults to DATA_PATH
         
     Returns:
         DataFrame with processed donation data
     """
-    if file_path is None:
-        file_path = DATA_PATH
+    return _load_data_cached(
+        file_path, _modified_time(file_path), _modified_time(HIJRI_LOOKUP_PATH)
+    )
+
+
+def _modified_time(path: Path) -> Optional[float]:
+    """Modification time of `path`, or None if it does not exist."""
+    return path.stat().st_mtime if path.exists() else None
+
+
+@st.cache_resource(ttl=DATA_CACHE_TTL, show_spinner=False)
+def _load_data_cached(
+    file_path: Path,
+    modified_time: Optional[float],
+    lookup_modified_time: Optional[float]
+) -> pd.DataFrame:
+    """
+    Load and process the data file; cached per path and modification times.
     
+    Args:
+        file_path: Path to the data file
+        modified_time: Modification time of the file, part of the cache key
+        lookup_modified_time: Modification time of the Hijri lookup table,
+            part of the cache key
+        
+    Returns:
+        DataFrame with processed donation data
+    """
     try:
         # Check if processed file exists
         if not file_path.exists():
@@ -38,17 +101,18 @@ def load_data(file_path: Optional[Path] = None) -> pd.DataFrame:
                 st.info("Please run: `python preprocess_data.py` to generate the processed dataset.")
                 return pd.DataFrame()
         
-        # Load processed data
-        df = pd.read_csv(file_path, encoding='utf-8')
-        
-        # Convert date columns
-        df['donationdate'] = pd.to_datetime(df['donationdate'], errors='coerce')
-        
-        # Drop rows with invalid dates
-        df = df.dropna(subset=['donationdate'])
+        # Use the Feather cache when it is at least as new as the CSV and the
+        # Hijri lookup table its calendar columns were derived from
+        cache_path = file_path.with_suffix('.feather')
+        if _is_newer(cache_path, [file_path, HIJRI_LOOKUP_PATH]):
+            df = _read_feather_cache(cache_path)
+            if df is not None:
+                return df
         
-        # Create date column (date only, no time)
-        df['date'] = df['donationdate'].dt.date
+        # Load processed data and rebuild the calendar columns
+        df = _load_donations_csv(file_path, PROCESSED_COLUMNS)
+        df = _optimize_dtypes(df)
+        _write_feather_cache(df, cache_path)
         
         return df
         
@@ -57,35 +121,211 @@ def load_data(file_path: Optional[Path] = None) -> pd.DataFrame:
         return pd.DataFrame()
 
 
+def _is_newer(path: Path, sources: list) -> bool:
+    """Check that `path` exists and is at least as new as every existing source."""
+    if not path.exists():
+        return False
+    
+    modified = path.stat().st_mtime
+    return all(modified >= source.stat().st_mtime for source in sources if source.exists())
+
+
+def _load_donations_csv(file_path: Path, columns: list) -> pd.DataFrame:
+    """
+    Read the source columns of a donations CSV and derive calendar columns.
+    
+    The file is read in chunks of CSV_CHUNK_SIZE rows and each chunk is
+    enriched before the next is parsed, which bounds peak memory on large
+    files.
+    
+    Args:
+        file_path: Path to the CSV file
+        columns: Columns to read
+        
+    Returns:
+        DataFrame with calendar columns sorted by `donationdate`, excluding
+        rows without a date or amount
+    """
+    reader = pd.read_csv(
+        file_path,
+        encoding='utf-8',
+        usecols=columns,
+        dtype={col: CSV_DTYPES[col] for col in columns if col in CSV_DTYPES},
+        parse_dates=['donationdate'],
+        date_format='ISO8601',
+        engine='c',
+        chunksize=CSV_CHUNK_SIZE
+    )
+    
+    with reader:
+        chunks = [_add_calendar_columns(_drop_invalid_rows(chunk)) for chunk in reader]
+    
+    # Sorted dates let filter_data locate date ranges by binary search
+    return pd.concat(chunks).sort_values('donationdate', kind='stable', ignore_index=True)
+
+
+def _drop_invalid_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drop rows without a valid donation date or amount.
+    
+    Args:
+        df: DataFrame read from a donations CSV
+        
+    Returns:
+        DataFrame with a datetime64 `donationdate` column
+    """
+    # Malformed dates leave the column unparsed; coerce them to NaT
+    if not pd.api.types.is_datetime64_any_dtype(df['donationdate']):
+        df['donationdate'] = pd.to_datetime(df['donationdate'], errors='coerce')
+    
+    # Copy so the calendar columns added next are written to a standalone
+    # frame rather than a filtered view (SettingWithCopyWarning on pandas 2)
+    return df.dropna(subset=['donationdate', 'amount']).copy()
+
+
+def _add_calendar_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add Gregorian and Hijri calendar columns derived from `donationdate`.
+    
+    Args:
+        df: DataFrame with a datetime64 `donationdate` column
+        
+    Returns:
+        DataFrame with time dimensions and Hijri calendar information
+    """
+    df = add_time_dimensions(df)
+    hijri_lookup = _get_hijri_lookup(df['date'])
+    return df.join(hijri_lookup, on='date')
+
+
+def _get_hijri_lookup(dates: pd.Series) -> pd.DataFrame:
+    """
+    Get Hijri calendar information for the given dates.
+    
+    Uses the prebuilt lookup table when available and converts only the
+    dates it does not cover.
+    
+    Args:
+        dates: Series of Gregorian dates
+        
+    Returns:
+        DataFrame indexed by date with Hijri calendar columns
+    """
+    table = _load_hijri_table(HIJRI_LOOKUP_PATH, _modified_time(HIJRI_LOOKUP_PATH))
+    
+    if table.empty:
+        return build_hijri_lookup(dates)
+    
+    unique_dates = pd.Index(dates.unique())
+    missing = unique_dates[~unique_dates.isin(table.index)]
+    
+    if missing.empty:
+        return table
+    
+    return pd.concat([table, build_hijri_lookup(missing)])
+
+
+@st.cache_data(show_spinner=False)
+def _load_hijri_table(file_path: Path, modified_time: Optional[float]) -> pd.DataFrame:
+    """
+    Load the prebuilt date to Hijri lookup table.
+    
+    Args:
+        file_path: Path to the lookup table (see build_hijri_table.py)
+        modified_time: Modification time of the table, part of the cache key
+        
+    Returns:
+        DataFrame indexed by date, or an empty DataFrame if unavailable
+    """
+    try:
+        return pd.read_parquet(file_path, engine='pyarrow').set_index('date')
+    except (OSError, ImportError):
+        return pd.DataFrame()
+
+
+def _optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink the in-memory footprint of the loaded data.
+    
+    Downcasts `amount` to float32, stores `is_ramadan` as bool and converts
+    low-cardinality text columns to categoricals.
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        DataFrame with compact dtypes
+    """
+    df['amount'] = pd.to_numeric(df['amount'], downcast='float')
+    
+    if 'is_ramadan' in df.columns:
+        df['is_ramadan'] = df['is_ramadan'].fillna(False).astype(bool)
+    
+    columns = [col for col in CATEGORY_COLUMNS if col in df.columns]
+    df[columns] = df[columns].astype('category')
+    return df
+
+
+def _read_feather_cache(cache_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Read the processed DataFrame from the Feather cache.
+    
+    The file is uncompressed Arrow IPC and is memory-mapped, so columns are
+    read without decompression or an intermediate buffer; converting them
+    to pandas still copies them into the process.
+    
+    Args:
+        cache_path: Feather file written by _write_feather_cache
+        
+    Returns:
+        Processed DataFrame with the dtypes it was saved with, or None if
+        the cache was written by a different FEATHER_CACHE_VERSION
+    """
+    from pyarrow import feather
+    
+    table = feather.read_table(cache_path, memory_map=True)
+    metadata = table.schema.metadata or {}
+    if metadata.get(b'cache_version') != FEATHER_CACHE_VERSION:
+        return None
+    
+    return table.to_pandas()
+
+
+def _write_feather_cache(df: pd.DataFrame, cache_path: Path):
+    """
+    Persist the processed DataFrame so later startups skip CSV parsing.
+    Failures are ignored since the cache is optional (e.g. read-only disks).
+    
+    Args:
+        df: Processed DataFrame
+        cache_path: Destination Feather file
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**table.schema.metadata, b'cache_version': FEATHER_CACHE_VERSION}
+        feather.write_feather(
+            table.replace_schema_metadata(metadata), cache_path, compression='uncompressed'
+        )
+        
+        # Remove the Parquet cache written by earlier versions of the app
+        cache_path.with_suffix('.parquet').unlink(missing_ok=True)
+    except (OSError, ImportError):
+        pass
+
+
 def _load_raw_data_fallback() -> pd.DataFrame:
     """
-    Load raw data and create minimal required columns.
+    Load raw data and derive calendar columns.
     Used as fallback when processed data is not available.
     """
-    df = pd.read_csv(RAW_DATA_PATH, encoding='utf-8')
-    df['donationdate'] = pd.to_datetime(df['donationdate'], errors='coerce')
-    df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
-    df = df.dropna(subset=['donationdate', 'amount'])
-    
-    # Add minimal required columns
-    df['year'] = df['donationdate'].dt.year
-    df['month'] = df['donationdate'].dt.month
-    df['month_name'] = df['donationdate'].dt.strftime('%B')
-    df['quarter'] = df['donationdate'].dt.quarter
-    df['day'] = df['donationdate'].dt.day
-    df['weekday'] = df['donationdate'].dt.day_name()
-    df['week'] = df['donationdate'].dt.isocalendar().week
-    df['hour'] = df['donationdate'].dt.hour
-    df['date'] = df['donationdate'].dt.date
-    
-    # Add empty Hijri columns
-    df['is_ramadan'] = False
-    df['islamic_event'] = None
-    df['hijri_month'] = None
-    df['hijri_month_name'] = None
-    df['donationtype_en'] = df.get('donationtype', '')
-    
-    st.warning("⚠️ Using raw data without Hijri calendar and translations.")
+    df = _load_donations_csv(RAW_DATA_PATH, RAW_COLUMNS)
+    df['donationtype_en'] = df['donationtype']
+    df = _optimize_dtypes(df)
+    
+    st.warning("⚠️ Using raw data without English translations.")
     st.info("For full features, please run: `python preprocess_data.py`")
     
     return df
@@ -107,9 +347,7 @@ def filter_data_by_date_range(
     Returns:
         Filtered DataFrame
     """
-    mask = (df['donationdate'].dt.date >= start_date) & \
-           (df['donationdate'].dt.date <= end_date)
-    return df[mask].copy()
+    return df[_date_range_mask(df, start_date, end_date)]
 
 
 def filter_data_by_categories(
@@ -131,17 +369,116 @@ def filter_data_by_categories(
     if not categories:
         return df
     
+    return df[_category_mask(df, categories, column)]
+
+
+@st.cache_resource(
+    ttl=DATA_CACHE_TTL,
+    max_entries=FILTER_CACHE_MAX_ENTRIES,
+    show_spinner=False,
+    hash_funcs=FRAME_HASH_FUNCS
+)
+def filter_data(
+    df: pd.DataFrame,
+    start_date,
+    end_date,
+    categories: Optional[list] = None
+) -> pd.DataFrame:
+    """
+    Filter DataFrame by date range and, optionally, donation categories.
+    
+    Loaded data is sorted by date, so the date range is found by binary
+    search and only the categories of the rows in range are scanned; for
+    unsorted frames both conditions are combined into one mask. The result
+    is shared by every chart and metric on the page. Results
+    are cached per filter selection and returned as the same read-only
+    object on every rerun, so downstream caches keyed on the frame hit
+    without rehashing it.
+    
+    Args:
+        df: Input DataFrame
+        start_date: Start date (datetime or date object)
+        end_date: End date (datetime or date object)
+        categories: List of categories to keep (all when empty or None)
+        
+    Returns:
+        Filtered DataFrame
+    """
+    dates = df['donationdate'].to_numpy()
+    
+    if not _is_sorted(dates):
+        mask = _date_range_mask(df, start_date, end_date)
+        
+        if categories:
+            np.logical_and(mask, _category_mask(df, categories), out=mask)
+        
+        return df[mask]
+    
+    # Data is stored sorted by date: the range is one contiguous slice, so
+    # only the category mask needs a scan, and only over that slice
+    start, end = _date_bounds(dates, start_date, end_date)
+    lo, hi = np.searchsorted(dates, [start, end], side='left')
+    sliced = df.iloc[lo:hi]
+    
+    if not categories:
+        return sliced
+    
+    return sliced[_category_mask(sliced, categories)]
+
+
+def _date_range_mask(df: pd.DataFrame, start_date, end_date) -> np.ndarray:
+    """Select donations made from start_date through end_date (inclusive)."""
+    # Compare the raw datetime64 values against bounds in the same unit,
+    # combining the two comparisons in place
+    dates = df['donationdate'].to_numpy()
+    start, end = _date_bounds(dates, start_date, end_date)
+    
+    mask = dates >= start
+    np.logical_and(mask, dates < end, out=mask)
+    return mask
+
+
+def _date_bounds(dates: np.ndarray, start_date, end_date) -> tuple:
+    """Half-open [start, end) datetime64 bounds covering whole days, in the unit of `dates`."""
+    unit = dates.dtype
+    start = pd.Timestamp(start_date).normalize().to_datetime64().astype(unit)
+    end = (pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)).to_datetime64().astype(unit)
+    return start, end
+
+
+def _is_sorted(dates: np.ndarray) -> bool:
+    """Check that datetime64 values are in ascending order (False if any is NaT)."""
+    # Comparing neighbours directly is much cheaper than
+    # Series.is_monotonic_increasing, which builds an index engine
+    return bool((dates[1:] >= dates[:-1]).all())
+
+
+def _category_mask(df: pd.DataFrame, categories: list, column: str = 'donationtype') -> np.ndarray:
+    """Select donations whose category is in `categories`."""
     # Try English column first if available
     if 'donationtype_en' in df.columns:
         column = 'donationtype_en'
     
-    return df[df[column].isin(categories)].copy()
+    values = df[column]
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.isin(categories).to_numpy()
+    
+    # Look each row's category code up in a per-category table instead of
+    # comparing strings; the extra last slot catches missing values (code -1)
+    selected = values.cat.categories.get_indexer(categories)
+    keep = np.zeros(len(values.cat.categories) + 1, dtype=bool)
+    keep[selected[selected >= 0]] = True
+    return keep[values.cat.codes.to_numpy()]
 
 
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=2, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def get_date_range(df: pd.DataFrame) -> tuple:
     """
     Get the min and max dates from the DataFrame.
     
+    Cached so pages can read the bounds for their date inputs on every
+    rerun without rescanning the dates.
+    
     Args:
         df: Input DataFrame
         
@@ -157,10 +494,14 @@ def get_date_range(df: pd.DataFrame) -> tuple:
     return min_date, max_date
 
 
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=2, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def get_unique_categories(df: pd.DataFrame) -> list:
     """
     Get list of unique donation categories.
     
+    Cached so filter widgets can list their options on every rerun without
+    rescanning the category column.
+    
     Args:
         df: Input DataFrame
         
@@ -177,19 +518,21 @@ def get_unique_categories(df: pd.DataFrame) -> list:
     return sorted(categories)
 
 
-def export_to_csv(df: pd.DataFrame) -> str:
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=2, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
+def export_to_csv(df: pd.DataFrame) -> bytes:
     """
-    Export DataFrame to CSV string.
+    Export DataFrame to UTF-8 encoded CSV bytes with caching.
     
     Args:
         df: DataFrame to export
         
     Returns:
-        CSV string
+        CSV bytes
     """
     return df.to_csv(index=False).encode('utf-8')
 
 
+@st.cache_data(ttl=DATA_CACHE_TTL, max_entries=2, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def get_data_summary(df: pd.DataFrame) -> dict:
     """
     Get summary statistics about the dataset.
@@ -8,10 +8,111 @@ import numpy as np
 from scipy import stats
 import streamlit as st
 from typing import Dict, Optional
-from ..config.settings import CACHE_TTL
+from ..config.settings import CACHE_TTL, AGGREGATE_CACHE_MAX_ENTRIES
+from ..utils.cache_utils import FRAME_HASH_FUNCS
+from ..utils.array_utils import top_n_positions
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(
+    ttl=CACHE_TTL,
+    max_entries=AGGREGATE_CACHE_MAX_ENTRIES,
+    show_spinner=False,
+    hash_funcs=FRAME_HASH_FUNCS
+)
+def aggregate_amounts(df: pd.DataFrame, by) -> pd.DataFrame:
+    """
+    Sum, mean and count donation amounts per group.
+    
+    Charts, tables and KPIs that group the same frame by the same keys
+    share this cached result, so each grouping is computed once.
+    
+    Args:
+        df: Input DataFrame
+        by: Column name or list of column names to group by
+        
+    Returns:
+        DataFrame indexed by the group keys with sum, mean and count columns
+    """
+    # Amounts are never missing after loading, so the group size is the
+    # donation count and no extra pass over the values is needed
+    grouped = df.groupby(by, observed=True)['amount']
+    return grouped.agg(['sum', 'mean', 'size']).rename(columns={'size': 'count'})
+
+
+@st.cache_data(
+    ttl=CACHE_TTL,
+    max_entries=AGGREGATE_CACHE_MAX_ENTRIES,
+    show_spinner=False,
+    hash_funcs=FRAME_HASH_FUNCS
+)
+def calculate_daily_totals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate total amount and donation count per day.
+    
+    Days are dense integer keys, so totals are scatter-added into one slot
+    per calendar day with np.bincount instead of hashing dates in a groupby.
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        DataFrame with date, amount, count and, when available, is_ramadan
+    """
+    dates = df['date'].to_numpy()
+    
+    if df.empty or pd.isna(dates).any():
+        # is_ramadan is constant within a day, so it does not split any groups
+        keys = ['date', 'is_ramadan'] if 'is_ramadan' in df.columns else ['date']
+        daily = aggregate_amounts(df, keys).reset_index()
+        return daily.drop(columns='mean').rename(columns={'sum': 'amount'})
+    
+    days = dates.astype('datetime64[D]').astype(np.int64)
+    first_day = days.min()
+    codes = days - first_day
+    
+    amounts = np.bincount(codes, weights=df['amount'].fillna(0).to_numpy(dtype=np.float64))
+    counts = np.bincount(codes)
+    present = np.flatnonzero(counts)
+    
+    daily = pd.DataFrame({
+        'date': (present + first_day).astype('datetime64[D]').astype(dates.dtype)
+    })
+    
+    if 'is_ramadan' in df.columns:
+        is_ramadan = np.zeros(len(counts), dtype=bool)
+        is_ramadan[codes] = df['is_ramadan'].to_numpy(dtype=bool)
+        daily['is_ramadan'] = is_ramadan[present]
+    
+    daily['amount'] = amounts[present]
+    daily['count'] = counts[present]
+    
+    return daily
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
+def aggregate_donors(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Total, count and average donation amounts per donor.
+    
+    Donor charts, tables and statistics share this cached result, so the
+    frame is grouped by donor once.
+    
+    Args:
+        df: Input DataFrame with an `id` column
+        
+    Returns:
+        DataFrame indexed by donor id with total_amount, donation_count
+        and avg_amount columns
+    """
+    # No consumer needs donors in id order, so skip sorting the group keys
+    return df.groupby('id', observed=True, sort=False)['amount'].agg(
+        total_amount='sum',
+        donation_count='size',
+        avg_amount='mean'
+    )
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def calculate_kpis(df: pd.DataFrame) -> Dict:
     """
     Calculate key performance indicators.
@@ -25,27 +126,47 @@ def calculate_kpis(df: pd.DataFrame) -> Dict:
     if df.empty:
         return _empty_kpis()
     
-    ramadan_df = df[df['is_ramadan'] == True] if 'is_ramadan' in df.columns else pd.DataFrame()
-    non_ramadan_df = df[df['is_ramadan'] == False] if 'is_ramadan' in df.columns else df
+    # Ramadan vs. non-Ramadan aggregates in a single grouped pass
+    if 'is_ramadan' in df.columns:
+        by_ramadan = aggregate_amounts(df, 'is_ramadan')
+    else:
+        by_ramadan = pd.DataFrame({'sum': [0], 'mean': [df['amount'].mean()], 'count': [0]}, index=[False])
+    
+    ramadan = by_ramadan.loc[True] if True in by_ramadan.index else None
+    non_ramadan = by_ramadan.loc[False] if False in by_ramadan.index else None
+    ramadan_count = int(ramadan['count']) if ramadan is not None else 0
+    
+    # Amounts are never missing after loading, so the summary statistics
+    # run directly on the underlying array without pandas' NaN handling;
+    # the float32 amounts are accumulated in float64 to keep totals exact
+    amounts = df['amount'].to_numpy()
     
     return {
         'total_donations': len(df),
-        'total_amount': df['amount'].sum(),
-        'avg_donation': df['amount'].mean(),
-        'median_donation': df['amount'].median(),
-        'std_donation': df['amount'].std(),
+        'total_amount': amounts.sum(dtype=np.float64),
+        'avg_donation': amounts.mean(dtype=np.float64),
+        'median_donation': np.median(amounts),
+        'std_donation': amounts.std(ddof=1, dtype=np.float64) if len(amounts) > 1 else np.nan,
         'unique_donors': df['id'].nunique() if 'id' in df.columns else 0,
-        'unique_types': df['donationtype'].nunique() if 'donationtype' in df.columns else 0,
-        'ramadan_donations': len(ramadan_df),
-        'ramadan_amount': ramadan_df['amount'].sum() if len(ramadan_df) > 0 else 0,
-        'ramadan_percentage': (len(ramadan_df) / len(df) * 100) if len(df) > 0 else 0,
-        'ramadan_avg': ramadan_df['amount'].mean() if len(ramadan_df) > 0 else 0,
-        'non_ramadan_avg': non_ramadan_df['amount'].mean() if len(non_ramadan_df) > 0 else 0,
-        'max_donation': df['amount'].max(),
-        'min_donation': df['amount'].min(),
+        'unique_types': _count_unique(df['donationtype']) if 'donationtype' in df.columns else 0,
+        'ramadan_donations': ramadan_count,
+        'ramadan_amount': ramadan['sum'] if ramadan_count > 0 else 0,
+        'ramadan_percentage': ramadan_count / len(df) * 100,
+        'ramadan_avg': ramadan['mean'] if ramadan_count > 0 else 0,
+        'non_ramadan_avg': non_ramadan['mean'] if non_ramadan is not None else 0,
+        'max_donation': amounts.max(),
+        'min_donation': amounts.min(),
     }
 
 
+def _count_unique(values: pd.Series) -> int:
+    """Count distinct non-null values, using the codes of categorical columns."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=1)))
+    return values.nunique()
+
+
 def _empty_kpis() -> Dict:
     """Return empty KPI dictionary."""
     return {
@@ -66,7 +187,7 @@ def _empty_kpis() -> Dict:
     }
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def calculate_growth_rate(df: pd.DataFrame, period: str = 'month') -> float:
     """
     Calculate growth rate for a given period.
@@ -82,18 +203,21 @@ def calculate_growth_rate(df: pd.DataFrame, period: str = 'month') -> float:
         return 0.0
     
     try:
-        if period == 'month':
-            grouped = df.groupby(df['donationdate'].dt.to_period('M'))['amount'].sum()
-        elif period == 'year':
-            grouped = df.groupby(df['donationdate'].dt.to_period('Y'))['amount'].sum()
-        else:
+        key = _period_key(df, period)
+        if key is None:
             return 0.0
         
-        if len(grouped) < 2:
+        # Only the last two periods with donations are needed, so mask them
+        # directly instead of grouping every row
+        amounts = df['amount'].to_numpy()
+        last = key.max()
+        earlier = key < last
+        
+        if not earlier.any():
             return 0.0
         
-        current = grouped.iloc[-1]
-        previous = grouped.iloc[-2]
+        current = amounts[key == last].sum(dtype=np.float64)
+        previous = amounts[key == key[earlier].max()].sum(dtype=np.float64)
         
         if previous == 0:
             return 0.0
@@ -103,7 +227,34 @@ def calculate_growth_rate(df: pd.DataFrame, period: str = 'month') -> float:
         return 0.0
 
 
-@st.cache_data(ttl=CACHE_TTL)
+def _period_key(df: pd.DataFrame, period: str) -> Optional[np.ndarray]:
+    """
+    Build an ordered integer key identifying each row's month or year.
+    
+    Args:
+        df: Input DataFrame
+        period: 'month' or 'year'
+        
+    Returns:
+        Integer array aligned with df rows, or None for unknown periods
+    """
+    # Reuse the calendar columns computed at load time when present
+    if 'year' in df.columns and 'month' in df.columns:
+        years = df['year'].to_numpy(dtype=np.int32)
+        months = df['month']
+    else:
+        dt = df['donationdate'].dt
+        years = dt.year.to_numpy(dtype=np.int32)
+        months = dt.month
+    
+    if period == 'month':
+        return years * 12 + months.to_numpy(dtype=np.int32)
+    if period == 'year':
+        return years
+    return None
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def calculate_donor_statistics(df: pd.DataFrame) -> Dict:
     """
     Calculate donor-related statistics.
@@ -124,11 +275,7 @@ def calculate_donor_statistics(df: pd.DataFrame) -> Dict:
             'top_donor_count': 0
         }
     
-    donor_stats = df.groupby('id').agg({
-        'amount': ['sum', 'count', 'mean']
-    })
-    
-    donor_stats.columns = ['total_amount', 'donation_count', 'avg_amount']
+    donor_stats = aggregate_donors(df)
     
     return {
         'total_donors': len(donor_stats),
@@ -141,7 +288,7 @@ def calculate_donor_statistics(df: pd.DataFrame) -> Dict:
     }
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def calculate_time_statistics(df: pd.DataFrame) -> Dict:
     """
     Calculate time-based statistics.
@@ -155,19 +302,19 @@ def calculate_time_statistics(df: pd.DataFrame) -> Dict:
     if df.empty:
         return {}
     
-    daily_amounts = df.groupby('date')['amount'].sum()
+    daily = calculate_daily_totals(df).set_index('date')
     
     return {
-        'busiest_day': df.groupby('date').size().idxmax(),
-        'highest_amount_day': daily_amounts.idxmax(),
-        'avg_daily_amount': daily_amounts.mean(),
-        'avg_daily_donations': len(df) / len(df['date'].unique()),
-        'busiest_month': df.groupby('month_name').size().idxmax() if 'month_name' in df.columns else None,
-        'busiest_weekday': df.groupby('weekday').size().idxmax() if 'weekday' in df.columns else None,
+        'busiest_day': daily['count'].idxmax(),
+        'highest_amount_day': daily['amount'].idxmax(),
+        'avg_daily_amount': daily['amount'].mean(),
+        'avg_daily_donations': len(df) / len(daily),
+        'busiest_month': aggregate_amounts(df, 'month_name')['count'].idxmax() if 'month_name' in df.columns else None,
+        'busiest_weekday': aggregate_amounts(df, 'weekday')['count'].idxmax() if 'weekday' in df.columns else None,
     }
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def calculate_category_statistics(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     """
     Calculate statistics by donation category.
@@ -184,12 +331,14 @@ def calculate_category_statistics(df: pd.DataFrame, top_n: int = 10) -> pd.DataF
     
     column = 'donationtype_en' if 'donationtype_en' in df.columns else 'donationtype'
     
-    category_stats = df.groupby(column).agg({
-        'amount': ['sum', 'mean', 'count'],
-        'id': 'nunique'
-    }).reset_index()
+    category_stats = df.groupby(column, observed=True).agg(
+        total_amount=('amount', 'sum'),
+        avg_amount=('amount', 'mean'),
+        count=('amount', 'size'),
+        unique_donors=('id', 'nunique')
+    ).reset_index()
     
-    category_stats.columns = ['category', 'total_amount', 'avg_amount', 'count', 'unique_donors']
+    category_stats = category_stats.rename(columns={column: 'category'})
     category_stats['percentage'] = (category_stats['total_amount'] / category_stats['total_amount'].sum()) * 100
     
     return category_stats.nlargest(top_n, 'total_amount')
@@ -246,7 +395,7 @@ def compare_periods(
     return comparison
 
 
-@st.cache_data(ttl=CACHE_TTL)
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, hash_funcs=FRAME_HASH_FUNCS)
 def get_top_donors(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     """
     Get top donors by total donation amount.
@@ -261,10 +410,9 @@ def get_top_donors(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     if df.empty or 'id' not in df.columns:
         return pd.DataFrame()
     
-    top_donors = df.groupby('id').agg({
-        'amount': ['sum', 'count', 'mean'],
-    }).reset_index()
+    donor_stats = aggregate_donors(df)
     
-    top_donors.columns = ['donor_id', 'total_amount', 'donation_count', 'avg_amount']
+    # Largest first, without sorting every donor
+    top = top_n_positions(donor_stats['total_amount'].to_numpy(), top_n)[::-1]
     
-    return top_donors.nlargest(top_n, 'total_amount')
+    return donor_stats.iloc[top].rename_axis('donor_id').reset_index()
@@ -1,3 +1,7 @@
 """Utility functions for the dashboard."""
 
-# Future utility functions can be added here
+from .date_utils import *
+from .hijri_calendar import *
+from .cache_utils import *
+from .format_utils import *
+from .array_utils import *
@@ -0,0 +1,29 @@
+"""
+Array Utilities
+Selection helpers for NumPy arrays backing aggregated results
+"""
+
+import numpy as np
+
+# ============================================================================
+# SELECTION
+# ============================================================================
+
+def top_n_positions(values: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    Find the positions of the top_n largest values.
+
+    Partitions instead of sorting, so only the selected values are ordered.
+
+    Args:
+        values: 1-D array of values
+        top_n: Number of positions to return
+
+    Returns:
+        Array of positions, ordered by ascending value
+    """
+    if top_n < len(values):
+        positions = np.argpartition(values, -top_n)[-top_n:]
+    else:
+        positions = np.arange(len(values))
+    return positions[np.argsort(values[positions], kind='stable')]
@@ -0,0 +1,67 @@
+"""
+Cache Utilities
+Cheap, reusable cache keys for DataFrames passed to cached functions
+"""
+
+import functools
+import hashlib
+import threading
+import weakref
+import pandas as pd
+
+# ============================================================================
+# DATAFRAME FINGERPRINTS
+# ============================================================================
+
+# id(df) -> (weak reference to df, fingerprint). Streamlit runs sessions on
+# separate threads, so access is guarded by a lock; it is reentrant because
+# a weakref callback can fire on a thread that already holds it.
+_fingerprints = {}
+_fingerprints_lock = threading.RLock()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Return a content hash of a DataFrame, computed once per object.
+
+    Streamlit hashes DataFrame arguments on every cached call, so a page
+    that draws several charts from the same frame would hash it once per
+    chart. The fingerprint is remembered for the lifetime of the object,
+    so later calls with the same frame are a dictionary lookup.
+
+    Args:
+        df: DataFrame to fingerprint (must not be mutated afterwards)
+
+    Returns:
+        Hex digest of the frame's columns, dtypes and values
+    """
+    key = id(df)
+    with _fingerprints_lock:
+        entry = _fingerprints.get(key)
+    # An id can be reused once its frame is collected, so trust the entry
+    # only while its weak reference still points at this frame
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+
+    digest = hashlib.md5()
+    digest.update(repr(list(zip(df.columns, df.dtypes.astype(str)))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    fingerprint = digest.hexdigest()
+
+    ref = weakref.ref(df, functools.partial(_forget, key))
+    with _fingerprints_lock:
+        _fingerprints[key] = (ref, fingerprint)
+    return fingerprint
+
+
+def _forget(key: int, ref: weakref.ref):
+    """Drop the fingerprint of a garbage-collected DataFrame."""
+    with _fingerprints_lock:
+        entry = _fingerprints.get(key)
+        # The id may already belong to a newer frame with its own entry
+        if entry is not None and entry[0] is ref:
+            del _fingerprints[key]
+
+
+# Pass as `hash_funcs` to st.cache_data for functions taking DataFrames
+FRAME_HASH_FUNCS = {pd.DataFrame: frame_fingerprint}
@@ -0,0 +1,50 @@
+"""
+Date Utilities
+Vectorized Gregorian calendar feature extraction
+"""
+
+import pandas as pd
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+MONTH_NAMES = [
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+]
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# ============================================================================
+# FEATURE EXTRACTION
+# ============================================================================
+
+def add_time_dimensions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add Gregorian calendar columns derived from `donationdate`.
+
+    Month and weekday names are built from integer codes rather than
+    per-row string formatting, and numeric parts use compact integer dtypes.
+
+    Args:
+        df: DataFrame with a datetime64 `donationdate` column
+
+    Returns:
+        DataFrame with year, month, month_name, quarter, day, weekday,
+        week, hour and date columns. `date` is the donation day as a
+        datetime64 value at midnight
+    """
+    dt = df['donationdate'].dt
+
+    df['year'] = dt.year.astype('int16')
+    df['month'] = dt.month.astype('int8')
+    df['month_name'] = pd.Categorical.from_codes(df['month'].to_numpy() - 1, MONTH_NAMES)
+    df['quarter'] = dt.quarter.astype('int8')
+    df['day'] = dt.day.astype('int8')
+    df['weekday'] = pd.Categorical.from_codes(dt.weekday.to_numpy(), WEEKDAY_NAMES)
+    df['week'] = dt.isocalendar().week.astype('int8')
+    df['hour'] = dt.hour.astype('int8')
+    df['date'] = dt.normalize()
+
+    return df
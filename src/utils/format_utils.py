@@ -0,0 +1,27 @@
+"""
+Format Utilities
+Display formatting for amounts shown in tables
+"""
+
+import pandas as pd
+
+# ============================================================================
+# AMOUNT FORMATTING
+# ============================================================================
+
+def format_aed(values: pd.Series, decimals: int = 2) -> list:
+    """
+    Format amounts as AED currency strings.
+
+    Formats the values as plain Python floats in one comprehension instead
+    of dispatching a lambda per element through Series.apply.
+
+    Args:
+        values: Series of amounts
+        decimals: Number of decimal places
+
+    Returns:
+        List of strings such as "AED 1,234.50", in the order of `values`
+    """
+    template = f"AED {{:,.{decimals}f}}".format
+    return [template(x) for x in values.tolist()]
@@ -0,0 +1,110 @@
+"""
+Hijri Calendar Utilities
+Vectorized Hijri calendar enrichment for donation dates
+"""
+
+import numpy as np
+import pandas as pd
+from hijri_converter import Gregorian
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+HIJRI_MONTH_NAMES = np.array([
+    'Muharram', 'Safar', 'Rabi al-Awwal', 'Rabi al-Thani',
+    'Jumada al-Awwal', 'Jumada al-Thani', 'Rajab', 'Shaban',
+    'Ramadan', 'Shawwal', 'Dhul Qadah', 'Dhul Hijjah'
+], dtype=object)
+
+RAMADAN_MONTH = 9
+
+# Index 0 means "no event"; Ramadan thirds occupy codes 1-3
+ISLAMIC_EVENT_NAMES = np.array([
+    None,
+    'Ramadan (First 10 Days)',
+    'Ramadan (Middle 10 Days)',
+    'Ramadan (Last 10 Days)',
+    'Eid al-Fitr',
+    'Hajj & Eid al-Adha',
+    'Day of Ashura',
+    'Mawlid al-Nabi',
+], dtype=object)
+
+RAMADAN_PERIOD_NAMES = np.array(
+    [None, 'First 10 Days', 'Middle 10 Days', 'Last 10 Days'], dtype=object
+)
+
+# ============================================================================
+# CONVERSION FUNCTIONS
+# ============================================================================
+
+def get_hijri_date(gregorian_date):
+    """Convert Gregorian date to Hijri date."""
+    try:
+        g = Gregorian(gregorian_date.year, gregorian_date.month, gregorian_date.day)
+        return g.to_hijri()
+    except (ValueError, OverflowError):
+        return None
+
+
+def build_hijri_lookup(dates) -> pd.DataFrame:
+    """
+    Build a per-date table of Hijri calendar information.
+
+    Each unique date is converted once, so the cost scales with the number
+    of distinct days rather than the number of donations.
+
+    Args:
+        dates: Iterable of Gregorian dates (may contain duplicates)
+
+    Returns:
+        DataFrame indexed by date with hijri_year, hijri_month, hijri_day,
+        is_ramadan, ramadan_period and islamic_event
+    """
+    uniq = pd.Index(pd.unique(np.asarray(dates)))
+
+    parts = np.zeros((len(uniq), 3), dtype=np.int16)
+    for i, d in enumerate(uniq):
+        h = get_hijri_date(d)
+        if h is not None:
+            parts[i] = (h.year, h.month, h.day)
+
+    # Dates outside the supported range are left out of the lookup
+    valid = parts[:, 1] > 0
+    uniq = uniq[valid]
+    hy, hm, hd = parts[valid].T
+
+    is_ramadan = hm == RAMADAN_MONTH
+
+    # Ramadan third: 1, 2 or 3 inside Ramadan, 0 otherwise
+    ramadan_code = is_ramadan * (1 + (hd > 10) + (hd > 20)).astype(np.int8)
+
+    event_code = ramadan_code.copy()
+    event_code[(hm == 10) & (hd <= 3)] = 4
+    event_code[(hm == 12) & (hd >= 8) & (hd <= 13)] = 5
+    event_code[(hm == 1) & (hd == 10)] = 6
+    event_code[(hm == 3) & (hd == 12)] = 7
+
+    return pd.DataFrame({
+        'hijri_year': hy,
+        'hijri_month': hm.astype(np.int8),
+        'hijri_day': hd.astype(np.int8),
+        'is_ramadan': is_ramadan,
+        'ramadan_period': np.take(RAMADAN_PERIOD_NAMES, ramadan_code),
+        'islamic_event': np.take(ISLAMIC_EVENT_NAMES, event_code),
+    }, index=uniq)
+
+
+def hijri_month_names(months: pd.Series) -> pd.Categorical:
+    """
+    Map Hijri month numbers to their names.
+
+    Args:
+        months: Series of Hijri month numbers (1-12), possibly with missing values
+
+    Returns:
+        Categorical of month names in calendar order
+    """
+    codes = months.fillna(0).to_numpy(dtype=np.int8) - 1
+    return pd.Categorical.from_codes(codes, HIJRI_MONTH_NAMES)